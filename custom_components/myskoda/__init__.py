@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from time import monotonic
 
 from aiohttp import ClientResponseError, InvalidUrlClientError
 from homeassistant.const import Platform
@@ -26,22 +28,33 @@ from myskoda.auth.authorization import (
     TokenExpiredError,
 )
 
+from .commands import CommandRateLimiter
 from .const import (
+    COMMAND_INTERVAL_PER_ACCOUNT_IN_SECONDS,
     CONF_FCM_TOKEN,
     CONF_PASSWORD,
     CONF_REFRESH_TOKEN,
     CONF_USERNAME,
     CONF_VINLIST,
     DOMAIN,
+    MAX_PARALLEL_FIRST_REFRESHES,
+)
+from .coordinator import (
+    MySkodaConfigEntry,
+    MySkodaDataUpdateCoordinator,
+    UserRefreshManager,
+    poll_interval,
 )
-from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
 from .device_action import async_setup_actions
+from .device_index import DATA_DEVICE_INDEX, async_setup_device_index
 from .error_handlers import handle_aiohttp_error
 from .issues import (
     async_create_tnc_issue,
     async_delete_spin_issue,
     async_delete_tnc_issue,
 )
+from .position_history import PositionHistoryStore
+from .store import MySkodaStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +78,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hook always fires exactly once regardless of the number of config
     entries, avoiding double-registration or lingering-after-unload issues.
     """
+    async_setup_device_index(hass)
     async_setup_actions(hass)
     return True
 
@@ -167,19 +181,90 @@ async def async_setup_entry(hass: HomeAssistant, entry: MySkodaConfigEntry) -> b
             new_data[CONF_REFRESH_TOKEN] = current_refresh_token
             hass.config_entries.async_update_entry(entry, data=new_data)
 
+    store = MySkodaStore(hass, entry.entry_id)
+    await store.async_load()
+    store.retain_vehicles(vehicles)
+    cached_user = store.restore_user()
+    positions = PositionHistoryStore(hass, entry.entry_id)
+    await positions.async_load()
+    positions.retain_vehicles(vehicles)
+
+    user_refresher = UserRefreshManager(myskoda, poll_interval(entry))
+    command_limiter = CommandRateLimiter(COMMAND_INTERVAL_PER_ACCOUNT_IN_SECONDS)
+    pending: list[MySkodaDataUpdateCoordinator] = []
+    restored: list[MySkodaDataUpdateCoordinator] = []
     for vin in vehicles:
-        coordinator = MySkodaDataUpdateCoordinator(hass, entry, myskoda, vin)
-        await coordinator.async_config_entry_first_refresh()
+        coordinator = MySkodaDataUpdateCoordinator(
+            hass,
+            entry,
+            myskoda,
+            vin,
+            user_refresher,
+            store,
+            positions,
+            command_limiter,
+        )
         coordinators[vin] = coordinator
+        # Vehicles cached on disk are set up right away and refreshed in the background.
+        if cached_user and (cached_vehicle := store.restore_vehicle(vin)):
+            coordinator.async_restore(cached_user, cached_vehicle)
+            restored.append(coordinator)
+        else:
+            pending.append(coordinator)
+
+    # Fetch all other vehicles concurrently, but limit the number of parallel requests.
+    # The user is fetched only once, the other vehicles wait for that request.
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_FIRST_REFRESHES)
+    setup_started = monotonic()
+
+    async def _async_first_refresh(coordinator: MySkodaDataUpdateCoordinator) -> None:
+        async with semaphore:
+            started = monotonic()
+            await coordinator.async_config_entry_first_refresh()
+            _LOGGER.debug(
+                "Initial data fetch for vin %s took %.2f seconds",
+                coordinator.vin,
+                monotonic() - started,
+            )
+
+    results = await asyncio.gather(
+        *(_async_first_refresh(coordinator) for coordinator in pending),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    _LOGGER.debug(
+        "Initial data fetch for %d vehicles took %.2f seconds",
+        len(pending),
+        monotonic() - setup_started,
+    )
 
     entry.runtime_data = coordinators
+    if restored:
+        entry.async_create_background_task(
+            hass, _async_refresh_restored(restored), f"{DOMAIN}_refresh_restored"
+        )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    hass.data[DATA_DEVICE_INDEX].async_invalidate()
 
     return True
 
 
+async def _async_refresh_restored(
+    coordinators: list[MySkodaDataUpdateCoordinator],
+) -> None:
+    """Fetch live data for the vehicles restored from disk, one after another.
+
+    MySkoda debounces vehicle refreshes for all vehicles together, so refreshing
+    them at the same time would leave all but the first and last on cached data.
+    """
+    for coordinator in coordinators:
+        await coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: MySkodaConfigEntry) -> bool:
     """Unload a config entry."""
 
@@ -199,10 +284,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: MySkodaConfigEntry) ->
             entry_data = {**entry.data}
             entry_data[CONF_FCM_TOKEN] = coord.myskoda.fcm_token
             hass.config_entries.async_update_entry(entry, data=entry_data)
+        coord.event_coalescer.async_shutdown()
+        coord.commands.async_shutdown()
         await coord.myskoda.disconnect()
+    for store in {coord.store for coord in coordinators.values()}:
+        await store.async_flush()
+    for positions in {coord.positions for coord in coordinators.values()}:
+        await positions.async_flush()
+    hass.data[DATA_DEVICE_INDEX].async_invalidate()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: MySkodaConfigEntry) -> None:
+    """Remove the data cached on disk when a config entry is removed."""
+    await MySkodaStore(hass, entry.entry_id).async_remove()
+    await PositionHistoryStore(hass, entry.entry_id).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: MySkodaConfigEntry):
     """Handle options update."""
     # Do a lazy reload of integration when configuration changed
@@ -27,6 +27,7 @@ from myskoda.models.vehicle_connection_status import VehicleConnectionStatus
 
 from .coordinator import MySkodaConfigEntry
 from .entity import MySkodaChargingProfileEntity, MySkodaEntity
+from .snapshot import VehicleSection
 from .utils import add_supported_charging_profile_entities, add_supported_entities
 
 
@@ -76,28 +77,28 @@ class MySkodaBinarySensor(MySkodaEntity, BinarySensorEntity):
 
 
 class AirConditioningBinarySensor(MySkodaBinarySensor):
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING})
+
     def _air_conditioning(self) -> AirConditioning | None:
         return self.vehicle.air_conditioning
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING]
-
 
 class StatusBinarySensor(MySkodaBinarySensor):
+    sections = frozenset({VehicleSection.STATUS})
+    required_capabilities = frozenset({CapabilityId.STATE})
+
     def _status(self) -> Status | None:
         return self.vehicle.status
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE]
-
 
 class VehicleConnectionBinarySensor(MySkodaBinarySensor):
+    sections = frozenset({VehicleSection.CONNECTION_STATUS})
+    required_capabilities = frozenset({CapabilityId.READINESS})
+
     def _connection_status(self) -> VehicleConnectionStatus | None:
         return self.vehicle.connection_status
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.READINESS]
-
 
 class ChargerConnected(AirConditioningBinarySensor):
     """Detects if the charger is connected to the car."""
@@ -247,7 +248,7 @@ class SunroofOpen(StatusBinarySensor):
     def available(self) -> bool:
         if status := self._status():
             return (
-                super().is_supported()
+                super().is_supported(self.capabilities)
                 and status.detail.sunroof != OpenState.UNSUPPORTED
             )
         return False
@@ -441,15 +442,18 @@ class VehicleInMotion(MySkodaBinarySensor):
     Fall back to positions errors.
     """
 
+    sections = frozenset({VehicleSection.CONNECTION_STATUS, VehicleSection.POSITIONS})
+
     entity_description = BinarySensorEntityDescription(
         key="vehicle_in_motion",
         device_class=BinarySensorDeviceClass.MOTION,
         translation_key="vehicle_in_motion",
     )
 
-    def is_supported(self) -> bool:
-        return self.has_any_capability(
-            [CapabilityId.READINESS, CapabilityId.PARKING_POSITION]
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:
+        return not capabilities.isdisjoint(
+            {CapabilityId.READINESS, CapabilityId.PARKING_POSITION}
         )
 
     @property
@@ -1,7 +1,6 @@
 """Button entities for MySkoda."""
 
 import logging
-from datetime import timedelta
 from typing import Coroutine
 
 from homeassistant.components.button import (
@@ -12,7 +11,6 @@ from homeassistant.components.button import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType  # pyright: ignore [reportAttributeAccessIssue]
-from homeassistant.util import Throttle
 from homeassistant.exceptions import ServiceValidationError
 
 from myskoda.models.info import CapabilityId
@@ -20,8 +18,8 @@ from myskoda.mqtt import OperationFailedError
 
 from aiohttp import ClientResponseError
 
-from .const import API_COOLDOWN_IN_SECONDS, CONF_READONLY, DOMAIN
-from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
+from .const import CONF_READONLY, DOMAIN
+from .coordinator import MySkodaConfigEntry
 from .entity import MySkodaEntity
 from .utils import add_supported_entities
 
@@ -48,9 +46,7 @@ class MySkodaButton(MySkodaEntity, ButtonEntity):
     Base class for all button entities in the MySkoda integration.
     """
 
-    def __init__(self, coordinator: MySkodaDataUpdateCoordinator, vin: str):
-        super().__init__(coordinator, vin)
-        self._is_enabled: bool = True
+    sections = frozenset()
 
     def _ensure_not_readonly(self):
         if self.coordinator.entry.options.get(CONF_READONLY):
@@ -59,53 +55,24 @@ class MySkodaButton(MySkodaEntity, ButtonEntity):
                 translation_key="readonly_mode",
             )
 
-    def is_supported(self) -> bool:
-        all_capabilities_present = all(
-            self.vehicle.has_capability(cap) for cap in self.required_capabilities()
-        )
-
-        return all_capabilities_present
-
-    def _disable_button(self):
-        self._is_enabled = False
-        self.async_write_ha_state()
-
-    def _enable_button(self):
-        self._is_enabled = True
-        self.async_write_ha_state()
-
     async def _press_button(self, to_call: Coroutine):
         """Press a button by executing to_call."""
         self._ensure_not_readonly()
-        if not self._is_enabled:
-            return
-
-        self._disable_button()
-        try:
-            await to_call
-        finally:
-            self._enable_button()
-
-    @property
-    def available(self) -> bool:
-        """Return whether the button is available to be pressed."""
-        return self._is_enabled
+        await self.async_send_command(to_call)
 
 
 class HonkFlash(MySkodaButton):
     """Honk and Flash."""
 
+    required_capabilities = frozenset({CapabilityId.HONK_AND_FLASH})
+
     entity_description = ButtonEntityDescription(
         key="honk_flash",
         translation_key="honk_flash",
         device_class=ButtonDeviceClass.IDENTIFY,
     )
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_press(self) -> None:
-        if not self._is_enabled:
-            return  # Ignore presses when disabled
-
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         try:
             await self._press_button(myskoda.honk_flash(vin))
@@ -113,22 +80,17 @@ class HonkFlash(MySkodaButton):
             _LOGGER.error("Failed honk and flash: %s", exc)
         _LOGGER.info("Sent honk and flash")
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.HONK_AND_FLASH]
-
 
 class Flash(MySkodaButton):
     """Flash."""
 
+    required_capabilities = frozenset({CapabilityId.HONK_AND_FLASH})
+
     entity_description = ButtonEntityDescription(
         key="flash", translation_key="flash", device_class=ButtonDeviceClass.IDENTIFY
     )
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_press(self) -> None:
-        if not self._is_enabled:
-            return  # Ignore presses when disabled
-
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         try:
             await self._press_button(myskoda.flash(vin))
@@ -136,9 +98,6 @@ class Flash(MySkodaButton):
             _LOGGER.error("Failed to flash lights: %s", exc)
         _LOGGER.info("Sent light flash")
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.HONK_AND_FLASH]
-
 
 class WakeUp(MySkodaButton):
     """Explicitly wake up the vehicle.
@@ -153,11 +112,7 @@ class WakeUp(MySkodaButton):
         entity_registry_enabled_default=False,
     )
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_press(self) -> None:
-        if not self._is_enabled:
-            return
-
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         try:
             await self._press_button(myskoda.wakeup(vin))
@@ -165,10 +120,12 @@ class WakeUp(MySkodaButton):
             _LOGGER.error("Failed to wake up vehicle: %s", exc)
         _LOGGER.info("Signaled vehicle to wake up")
 
-    def is_supported(self) -> bool:
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:
         """Some models have VEHICLE_WAKE_UP while others have VEHICLE_WAKE_UP_TRIGGER."""
-        capabilities = [
-            CapabilityId.VEHICLE_WAKE_UP,
-            CapabilityId.VEHICLE_WAKE_UP_TRIGGER,
-        ]
-        return any(self.vehicle.has_capability(cap) for cap in capabilities)
+        return not capabilities.isdisjoint(
+            {
+                CapabilityId.VEHICLE_WAKE_UP,
+                CapabilityId.VEHICLE_WAKE_UP_TRIGGER,
+            }
+        )
@@ -1,7 +1,7 @@
 """Climate entities for MySkoda."""
 
+import asyncio
 import logging
-from datetime import timedelta
 from enum import StrEnum
 from typing import Any
 
@@ -16,13 +16,13 @@ from homeassistant.components.climate.const import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import (
     DiscoveryInfoType,  # pyright: ignore [reportAttributeAccessIssue]
 )
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.util import Throttle
 
 from aiohttp import ClientResponseError
 
@@ -42,13 +42,14 @@ from myskoda.models.info import CapabilityId
 from myskoda.mqtt import OperationFailedError
 
 from .const import (
-    API_COOLDOWN_IN_SECONDS,
+    CLIMATE_BATCH_WINDOW_IN_SECONDS,
     CONF_READONLY,
     CONF_SPIN,
     DOMAIN,
 )
 from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
 from .entity import MySkodaEntity
+from .snapshot import VehicleSection
 from .utils import add_supported_entities
 
 _LOGGER = logging.getLogger(__name__)
@@ -125,10 +126,16 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
                 translation_key="readonly_mode",
             )
 
+    def _changes_pending(self) -> bool:
+        """Return True while a requested change has not been applied yet."""
+        return self._operation_in_progress
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic values when fresh data arrives and no operation in progress."""
-        if not self._operation_in_progress:
+        if not self._sections_changed():
+            return
+        if not self._changes_pending():
             self._optimistic_data = {}
         super()._handle_coordinator_update()
 
@@ -136,7 +143,10 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.stop_auxiliary_heating(self.vehicle.info.vin)
+            await self.async_send_command(
+                self.coordinator.myskoda.stop_auxiliary_heating(self.vehicle.info.vin),
+                "auxiliary_heating",
+            )
         finally:
             self._operation_in_progress = False
 
@@ -146,10 +156,13 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.start_auxiliary_heating(
-                vin=self.vehicle.info.vin,
-                spin=spin,
-                config=config,
+            await self.async_send_command(
+                self.coordinator.myskoda.start_auxiliary_heating(
+                    vin=self.vehicle.info.vin,
+                    spin=spin,
+                    config=config,
+                ),
+                "auxiliary_heating",
             )
         finally:
             self._operation_in_progress = False
@@ -158,7 +171,10 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.stop_air_conditioning(self.vehicle.info.vin)
+            await self.async_send_command(
+                self.coordinator.myskoda.stop_air_conditioning(self.vehicle.info.vin),
+                "air_conditioning",
+            )
         finally:
             self._operation_in_progress = False
 
@@ -166,8 +182,11 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.start_air_conditioning(
-                self.vehicle.info.vin, temperature
+            await self.async_send_command(
+                self.coordinator.myskoda.start_air_conditioning(
+                    self.vehicle.info.vin, temperature
+                ),
+                "air_conditioning",
             )
         finally:
             self._operation_in_progress = False
@@ -176,8 +195,11 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.start_camping(
-                self.vehicle.info.vin, temperature
+            await self.async_send_command(
+                self.coordinator.myskoda.start_camping(
+                    self.vehicle.info.vin, temperature
+                ),
+                "camping",
             )
         finally:
             self._operation_in_progress = False
@@ -186,7 +208,9 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.stop_camping(self.vehicle.info.vin)
+            await self.async_send_command(
+                self.coordinator.myskoda.stop_camping(self.vehicle.info.vin), "camping"
+            )
         finally:
             self._operation_in_progress = False
 
@@ -194,7 +218,10 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.start_ventilation(self.vehicle.info.vin)
+            await self.async_send_command(
+                self.coordinator.myskoda.start_ventilation(self.vehicle.info.vin),
+                "ventilation",
+            )
         finally:
             self._operation_in_progress = False
 
@@ -202,7 +229,10 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.stop_ventilation(self.vehicle.info.vin)
+            await self.async_send_command(
+                self.coordinator.myskoda.stop_ventilation(self.vehicle.info.vin),
+                "ventilation",
+            )
         finally:
             self._operation_in_progress = False
 
@@ -210,8 +240,11 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
         self._ensure_not_readonly()
         self._operation_in_progress = True
         try:
-            await self.coordinator.myskoda.set_target_temperature(
-                self.vehicle.info.vin, temperature
+            await self.async_send_command(
+                self.coordinator.myskoda.set_target_temperature(
+                    self.vehicle.info.vin, temperature
+                ),
+                "target_temperature",
             )
         finally:
             self._operation_in_progress = False
@@ -220,11 +253,38 @@ class MySkodaClimateEntity(MySkodaEntity, ClimateEntity):
 class MySkodaClimate(MySkodaClimateEntity):
     """Climate control for MySkoda vehicles."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+
     entity_description = ClimateEntityDescription(
         key="climate",
         translation_key="climate",
     )
 
+    def __init__(self, coordinator: MySkodaDataUpdateCoordinator, vin: str) -> None:  # noqa: D107
+        super().__init__(coordinator, vin)
+        # Changes requested within the batch window, in the order they were requested
+        self._requested: dict[OptimisticAttribute, Any] = {}
+        self._requested_applied: asyncio.Future | None = None
+        self._camping_before_request: bool = False
+        self._applying_changes: bool = False
+        self._unsub_apply: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:  # noqa: D102
+        if self._unsub_apply is not None:
+            self._unsub_apply()
+            self._unsub_apply = None
+        if self._requested_applied is not None:
+            self._requested_applied.cancel()
+            self._requested_applied = None
+        await super().async_will_remove_from_hass()
+
+    def _changes_pending(self) -> bool:
+        return (
+            self._requested_applied is not None
+            or self._applying_changes
+            or super()._changes_pending()
+        )
+
     def _is_ventilation_only(self) -> bool:
         """Return True for vehicles that support ventilation but not full air conditioning."""
         return self.has_all_capabilities(
@@ -327,67 +387,11 @@ class MySkodaClimate(MySkodaClimateEntity):
                 return
             return target_temperature.temperature_value
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):  # noqa: D102
-        if self._is_ventilation_only():
-            self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, hvac_mode)
-            if hvac_mode == HVACMode.FAN_ONLY:
-                _LOGGER.info("Starting ventilation.")
-                try:
-                    await self._start_ventilation()
-                except (ClientResponseError, OperationFailedError) as exc:
-                    self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                    _LOGGER.error("Failed to start ventilation: %s", exc)
-            else:
-                _LOGGER.info("Stopping ventilation.")
-                try:
-                    await self._stop_ventilation()
-                except (ClientResponseError, OperationFailedError) as exc:
-                    _LOGGER.error("Failed to stop ventilation: %s", exc)
-            _LOGGER.info("HVAC mode set to %s.", hvac_mode)
-            return
-
-        if not (ac := self._air_conditioning()):
-            return
-
-        if not (target_temperature := ac.target_temperature):
-            return
-
-        self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, hvac_mode)
-        if hvac_mode == HVACMode.HEAT_COOL:
-            if ac.state == AirConditioningState.HEATING_AUXILIARY:
-                _LOGGER.info("Auxiliary heating detected, stopping first.")
-                try:
-                    await self._stop_auxiliary_heating()
-                except (ClientResponseError, OperationFailedError) as exc:
-                    self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                    _LOGGER.error("Failed to stop aux heater, aborting action: %s", exc)
-                    return
-            _LOGGER.info("Starting Air conditioning.")
-            try:
-                await self._start_air_conditioning(target_temperature.temperature_value)
-            except (ClientResponseError, OperationFailedError) as exc:
-                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                _LOGGER.error("Failed to start air conditioning: %s", exc)
-        elif self._supports_camping() and self._is_camping_active():
-            # Camping keeps the AC running; a plain _stop_air_conditioning would not
-            # end it, so call _stop_camping instead.
-            self._set_optimistic_data(OptimisticAttribute.PRESET_MODE, PRESET_NONE)
-            _LOGGER.info("Camping mode active, stopping camping mode.")
-            try:
-                await self._stop_camping()
-            except (ClientResponseError, OperationFailedError) as exc:
-                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                self._unset_optimistic_data(OptimisticAttribute.PRESET_MODE)
-                _LOGGER.error("Failed to stop camping mode: %s", exc)
-        else:
-            _LOGGER.info("Stopping Air conditioning.")
-            try:
-                await self._stop_air_conditioning()
-            except (ClientResponseError, OperationFailedError) as exc:
-                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                _LOGGER.error("Failed to stop air conditioning: %s", exc)
-        _LOGGER.info("HVAC mode set to %s.", hvac_mode)
+        if not self._is_ventilation_only():
+            if not (ac := self._air_conditioning()) or not ac.target_temperature:
+                return
+        await self._async_request_change(OptimisticAttribute.HVAC_MODE, hvac_mode)
 
     async def async_turn_on(self):  # noqa: D102
         if self._is_ventilation_only():
@@ -398,44 +402,21 @@ class MySkodaClimate(MySkodaClimateEntity):
     async def async_turn_off(self):  # noqa: D102
         await self.async_set_hvac_mode(HVACMode.OFF)
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_set_preset_mode(self, preset_mode: str) -> None:  # noqa: D102
         if not self._supports_camping():
             return
 
         if preset_mode == PRESET_CAMPING:
-            if not (ac := self._air_conditioning()) or not (
-                target_temperature := ac.target_temperature
-            ):
+            if self.target_temperature is None:
                 raise ServiceValidationError(
                     translation_domain=DOMAIN,
                     translation_key="camping_no_target_temperature",
                 )
-            self._set_optimistic_data(OptimisticAttribute.PRESET_MODE, preset_mode)
-            self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, HVACMode.HEAT_COOL)
-            _LOGGER.info("Starting camping mode.")
-            try:
-                await self._start_camping(target_temperature.temperature_value)
-            except (ClientResponseError, OperationFailedError) as exc:
-                self._unset_optimistic_data(OptimisticAttribute.PRESET_MODE)
-                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                _LOGGER.error("Failed to start camping mode: %s", exc)
-        elif preset_mode == PRESET_NONE:
-            if self._is_camping_active():
-                self._set_optimistic_data(OptimisticAttribute.PRESET_MODE, preset_mode)
-                self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, HVACMode.OFF)
-                _LOGGER.info("Stopping camping mode.")
-                try:
-                    await self._stop_camping()
-                except (ClientResponseError, OperationFailedError) as exc:
-                    self._unset_optimistic_data(OptimisticAttribute.PRESET_MODE)
-                    self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
-                    _LOGGER.error("Failed to stop camping mode: %s", exc)
-        else:
+        elif preset_mode != PRESET_NONE:
             _LOGGER.warning("Unsupported preset mode: %s", preset_mode)
-        _LOGGER.info("Preset mode set to %s.", preset_mode)
+            return
+        await self._async_request_change(OptimisticAttribute.PRESET_MODE, preset_mode)
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_set_temperature(self, **kwargs):  # noqa: D102
         temp = kwargs[ATTR_TEMPERATURE]
         if temp < self.min_temp:
@@ -443,23 +424,191 @@ class MySkodaClimate(MySkodaClimateEntity):
         elif temp > self.max_temp:
             temp = self.max_temp
 
-        self._set_optimistic_data(OptimisticAttribute.TARGET_TEMPERATURE, temp)
+        await self._async_request_change(OptimisticAttribute.TARGET_TEMPERATURE, temp)
+
+    async def _async_request_change(
+        self, attr: OptimisticAttribute, value: Any
+    ) -> None:
+        """Request a change and wait until it has been applied.
+
+        Changes requested within CLIMATE_BATCH_WINDOW_IN_SECONDS of the first one
+        are applied together, with as few commands as possible. The requested
+        values are shown as optimistic data in the meantime.
+        """
+        self._ensure_not_readonly()
+        if (applied := self._requested_applied) is None:
+            self._camping_before_request = (
+                self._supports_camping() and self._is_camping_active()
+            )
+            self._requested_applied = applied = self.hass.loop.create_future()
+            self._unsub_apply = async_call_later(
+                self.hass,
+                CLIMATE_BATCH_WINDOW_IN_SECONDS,
+                self._async_apply_requested_changes,
+            )
+        # Keep the changes in the order they were last requested.
+        self._requested.pop(attr, None)
+        self._requested[attr] = value
+        self._set_optimistic_data(attr, value)
+        await asyncio.shield(applied)
+
+    async def _async_apply_requested_changes(self, _now=None) -> None:
+        """Apply the changes requested within the batch window."""
+        self._unsub_apply = None
+        requested, self._requested = self._requested, {}
+        applied, self._requested_applied = self._requested_applied, None
+        self._applying_changes = True
         try:
-            await self._set_target_temperature(temp)
-            _LOGGER.info("Target temperature set to %s.", temp)
+            await self._async_apply_changes(requested)
+        finally:
+            self._applying_changes = False
+            if applied is not None and not applied.done():
+                applied.set_result(None)
+
+    async def _async_apply_changes(
+        self, requested: dict[OptimisticAttribute, Any]
+    ) -> None:
+        """Merge the requested changes into commands and send them.
+
+        A target temperature is sent along with starting the air conditioning
+        or camping mode, and only set on its own otherwise. When both the HVAC
+        mode and the preset are requested and they contradict each other, the
+        one requested last wins.
+        """
+        hvac_mode: HVACMode | None = requested.get(OptimisticAttribute.HVAC_MODE)
+        preset_mode: str | None = requested.get(OptimisticAttribute.PRESET_MODE)
+        temperature: float | None = requested.get(
+            OptimisticAttribute.TARGET_TEMPERATURE
+        )
+
+        if self._is_ventilation_only():
+            if hvac_mode is not None:
+                await self._async_apply_ventilation(hvac_mode)
+            return
+
+        if preset_mode is not None and hvac_mode is not None:
+            last = next(
+                attr
+                for attr in reversed(requested)
+                if attr != OptimisticAttribute.TARGET_TEMPERATURE
+            )
+            if last == OptimisticAttribute.PRESET_MODE:
+                if preset_mode == PRESET_CAMPING:
+                    hvac_mode = None
+            elif hvac_mode == HVACMode.OFF and preset_mode == PRESET_CAMPING:
+                preset_mode = None
+
+        if preset_mode == PRESET_CAMPING:
+            self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, HVACMode.HEAT_COOL)
+            await self._async_apply_start_camping(temperature)
+            return
+
+        camping = self._camping_before_request
+        if camping and (preset_mode == PRESET_NONE or hvac_mode == HVACMode.OFF):
+            self._set_optimistic_data(OptimisticAttribute.PRESET_MODE, PRESET_NONE)
+            if hvac_mode is None:
+                self._set_optimistic_data(OptimisticAttribute.HVAC_MODE, HVACMode.OFF)
+            _LOGGER.info("Stopping camping mode.")
+            try:
+                await self._stop_camping()
+            except (ClientResponseError, OperationFailedError) as exc:
+                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
+                self._unset_optimistic_data(OptimisticAttribute.PRESET_MODE)
+                _LOGGER.error("Failed to stop camping mode: %s", exc)
+                return
+
+        if hvac_mode == HVACMode.HEAT_COOL:
+            await self._async_apply_start_air_conditioning(temperature)
+            return
+        if hvac_mode == HVACMode.OFF and not camping:
+            _LOGGER.info("Stopping Air conditioning.")
+            try:
+                await self._stop_air_conditioning()
+            except (ClientResponseError, OperationFailedError) as exc:
+                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
+                _LOGGER.error("Failed to stop air conditioning: %s", exc)
+        if hvac_mode is not None:
+            _LOGGER.info("HVAC mode set to %s.", hvac_mode)
+
+        if temperature is not None:
+            try:
+                await self._set_target_temperature(temperature)
+                _LOGGER.info("Target temperature set to %s.", temperature)
+            except (ClientResponseError, OperationFailedError) as exc:
+                self._unset_optimistic_data(OptimisticAttribute.TARGET_TEMPERATURE)
+                _LOGGER.error("Failed to set target temperature: %s", exc)
+
+    async def _async_apply_ventilation(self, hvac_mode: HVACMode) -> None:
+        if hvac_mode == HVACMode.FAN_ONLY:
+            _LOGGER.info("Starting ventilation.")
+            try:
+                await self._start_ventilation()
+            except (ClientResponseError, OperationFailedError) as exc:
+                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
+                _LOGGER.error("Failed to start ventilation: %s", exc)
+        else:
+            _LOGGER.info("Stopping ventilation.")
+            try:
+                await self._stop_ventilation()
+            except (ClientResponseError, OperationFailedError) as exc:
+                _LOGGER.error("Failed to stop ventilation: %s", exc)
+        _LOGGER.info("HVAC mode set to %s.", hvac_mode)
+
+    async def _async_apply_start_camping(self, temperature: float | None) -> None:
+        if temperature is None:
+            if not (ac := self._air_conditioning()) or not ac.target_temperature:
+                return
+            temperature = ac.target_temperature.temperature_value
+        _LOGGER.info("Starting camping mode.")
+        try:
+            await self._start_camping(temperature)
         except (ClientResponseError, OperationFailedError) as exc:
+            self._unset_optimistic_data(OptimisticAttribute.PRESET_MODE)
+            self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
             self._unset_optimistic_data(OptimisticAttribute.TARGET_TEMPERATURE)
-            _LOGGER.error("Failed to set target temperature: %s", exc)
+            _LOGGER.error("Failed to start camping mode: %s", exc)
+            return
+        _LOGGER.info("Preset mode set to %s.", PRESET_CAMPING)
+
+    async def _async_apply_start_air_conditioning(
+        self, temperature: float | None
+    ) -> None:
+        if not (ac := self._air_conditioning()) or not ac.target_temperature:
+            return
+        if ac.state == AirConditioningState.HEATING_AUXILIARY:
+            _LOGGER.info("Auxiliary heating detected, stopping first.")
+            try:
+                await self._stop_auxiliary_heating()
+            except (ClientResponseError, OperationFailedError) as exc:
+                self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
+                _LOGGER.error("Failed to stop aux heater, aborting action: %s", exc)
+                return
+        if temperature is None:
+            temperature = ac.target_temperature.temperature_value
+        _LOGGER.info("Starting Air conditioning.")
+        try:
+            await self._start_air_conditioning(temperature)
+        except (ClientResponseError, OperationFailedError) as exc:
+            self._unset_optimistic_data(OptimisticAttribute.HVAC_MODE)
+            self._unset_optimistic_data(OptimisticAttribute.TARGET_TEMPERATURE)
+            _LOGGER.error("Failed to start air conditioning: %s", exc)
+            return
+        _LOGGER.info("HVAC mode set to %s.", HVACMode.HEAT_COOL)
 
-    def is_supported(self) -> bool:  # noqa: D102
-        return self.has_any_capability(
-            [CapabilityId.AIR_CONDITIONING, CapabilityId.ACTIVE_VENTILATION]
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:  # noqa: D102
+        return not capabilities.isdisjoint(
+            {CapabilityId.AIR_CONDITIONING, CapabilityId.ACTIVE_VENTILATION}
         )
 
 
 class AuxiliaryHeater(MySkodaClimateEntity):
     """Auxiliary heater control for MySkoda vehicles."""
 
+    sections = frozenset(
+        {VehicleSection.AUXILIARY_HEATING, VehicleSection.AIR_CONDITIONING}
+    )
+
     entity_description = ClimateEntityDescription(
         key="auxiliary_heater",
         translation_key="auxiliary_heater",
@@ -584,7 +733,6 @@ class AuxiliaryHeater(MySkodaClimateEntity):
         if target_temperature := self._target_temperature:
             return target_temperature.temperature_value
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):  # noqa: D102
         if not (state := self._state):
             _LOGGER.error("Can't retrieve air-conditioning info")
@@ -656,11 +804,12 @@ class AuxiliaryHeater(MySkodaClimateEntity):
     async def async_turn_off(self):  # noqa: D102
         await self.async_set_hvac_mode(HVACMode.OFF)
 
-    def is_supported(self) -> bool:
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:
         """Return true if any supported capability is present."""
-        return self.has_any_capability(
-            [
+        return not capabilities.isdisjoint(
+            {
                 CapabilityId.AUXILIARY_HEATING,
                 CapabilityId.AIR_CONDITIONING_HEATING_SOURCE_AUXILIARY,
-            ]
+            }
         )
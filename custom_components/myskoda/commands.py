@@ -0,0 +1,142 @@
+"""Queue the commands sent to a vehicle."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Coroutine, Hashable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandRateLimiter:
+    """Keep a minimum interval between commands."""
+
+    def __init__(self, interval: float) -> None:
+        """Create a new rate limiter."""
+        self.interval: float = interval
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._next: float = 0.0
+
+    async def async_wait(self) -> None:
+        """Wait until the next command may be sent."""
+        async with self._lock:
+            if (delay := self._next - monotonic()) > 0:
+                await asyncio.sleep(delay)
+            self._next = monotonic() + self.interval
+
+
+@dataclass
+class CommandStats:
+    """Counters of the commands sent to a vehicle."""
+
+    executed: int = 0
+    # Commands replaced by a newer command for the same setting before being sent
+    collapsed: int = 0
+    failed: int = 0
+
+
+@dataclass
+class _Command:
+    coroutine: Coroutine[Any, Any, Any]
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+class CommandExecutor:
+    """Send the commands for a vehicle one at a time.
+
+    Commands are identified by a key, naming the setting they change. A command
+    that is still queued when a newer command with the same key arrives is
+    dropped, and its callers receive the outcome of the newer command instead.
+    Turning a switch on, off and on again therefore sends a single command.
+
+    Commands are spaced by the interval of the vehicle, and by the interval of
+    the account which is shared by all vehicles of a config entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        vin: str,
+        account_limiter: CommandRateLimiter,
+        interval: float,
+    ) -> None:
+        """Create a new command executor."""
+        self.hass: HomeAssistant = hass
+        self.vin: str = vin
+        self.stats: CommandStats = CommandStats()
+        self._account_limiter: CommandRateLimiter = account_limiter
+        self._limiter: CommandRateLimiter = CommandRateLimiter(interval)
+        self._queue: OrderedDict[Hashable, _Command] = OrderedDict()
+        self._running: Hashable | None = None
+        self._worker: asyncio.Task | None = None
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Check if a command with this key is queued or being sent."""
+        return key in self._queue or key == self._running
+
+    async def async_execute(
+        self, key: Hashable, coroutine: Coroutine[Any, Any, Any]
+    ) -> Any:
+        """Queue a command and return its result once it has been sent."""
+        future = self.hass.loop.create_future()
+        if (queued := self._queue.get(key)) is not None:
+            _LOGGER.debug("Replacing queued command %s for vin %s", key, self.vin)
+            queued.coroutine.close()
+            queued.coroutine = coroutine
+            self.stats.collapsed += 1
+        else:
+            queued = self._queue[key] = _Command(coroutine)
+        queued.futures.append(future)
+
+        if self._worker is None:
+            self._worker = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN}_commands_{self.vin}"
+            )
+        return await future
+
+    async def _async_run(self) -> None:
+        """Send the queued commands in order."""
+        try:
+            while self._queue:
+                await self._limiter.async_wait()
+                await self._account_limiter.async_wait()
+                key, command = self._queue.popitem(last=False)
+                self._running = key
+                try:
+                    result = await command.coroutine
+                except asyncio.CancelledError:
+                    for future in command.futures:
+                        future.cancel()
+                    raise
+                except Exception as exc:  # Passed on to the callers of the command
+                    self.stats.failed += 1
+                    for future in command.futures:
+                        if not future.done():
+                            future.set_exception(exc)
+                else:
+                    self.stats.executed += 1
+                    for future in command.futures:
+                        if not future.done():
+                            future.set_result(result)
+                finally:
+                    self._running = None
+        finally:
+            self._worker = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all queued commands and stop sending."""
+        for command in self._queue.values():
+            command.coroutine.close()
+            for future in command.futures:
+                future.cancel()
+        self._queue.clear()
+        if self._worker is not None:
+            self._worker.cancel()
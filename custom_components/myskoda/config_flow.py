@@ -36,12 +36,20 @@ from myskoda.auth.authorization import (
 )
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_EVENT_WINDOW,
+    CONF_EVENT_WINDOW_MAX,
+    CONF_EVENT_WINDOW_MIN,
+    CONF_HISTORY_SIZE_MAX,
+    CONF_HISTORY_SIZE_MIN,
+    CONF_OPERATION_HISTORY_SIZE,
     CONF_PASSWORD,
     CONF_POLL_INTERVAL,
     CONF_POLL_INTERVAL_MAX,
     CONF_POLL_INTERVAL_MIN,
     CONF_READONLY,
     CONF_REFRESH_TOKEN,
+    CONF_SERVICE_EVENT_HISTORY_SIZE,
     CONF_SPIN,
     CONF_TRACING,
     CONF_USERNAME,
@@ -62,6 +70,20 @@ async def validate_options_input(
         if not CONF_POLL_INTERVAL_MIN <= polling_interval <= CONF_POLL_INTERVAL_MAX:
             raise SchemaFlowError("invalid_polling_interval")
 
+    if CONF_EVENT_WINDOW in user_input:
+        event_window: int = user_input[CONF_EVENT_WINDOW]
+        if not CONF_EVENT_WINDOW_MIN <= event_window <= CONF_EVENT_WINDOW_MAX:
+            raise SchemaFlowError("invalid_event_window")
+
+    for history_option in (
+        CONF_OPERATION_HISTORY_SIZE,
+        CONF_SERVICE_EVENT_HISTORY_SIZE,
+    ):
+        if history_option in user_input:
+            history_size: int = user_input[history_option]
+            if not CONF_HISTORY_SIZE_MIN <= history_size <= CONF_HISTORY_SIZE_MAX:
+                raise SchemaFlowError("invalid_history_size")
+
     if CONF_SPIN in user_input:
         s_pin: str = user_input[CONF_SPIN]
         if not s_pin.isdigit():
@@ -100,6 +122,10 @@ OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_TRACING, default=False): bool,
         vol.Optional(CONF_POLL_INTERVAL): int,
+        vol.Optional(CONF_ADAPTIVE_POLLING, default=False): bool,
+        vol.Optional(CONF_EVENT_WINDOW): int,
+        vol.Optional(CONF_OPERATION_HISTORY_SIZE): int,
+        vol.Optional(CONF_SERVICE_EVENT_HISTORY_SIZE): int,
         vol.Optional(CONF_READONLY, default=False): bool,
         vol.Optional(CONF_SPIN): str,
     }
@@ -4,8 +4,17 @@ DOMAIN = "myskoda"
 
 # Timing information
 DEFAULT_FETCH_INTERVAL_IN_MINUTES = 30
-API_COOLDOWN_IN_SECONDS = 30.0
+COMMAND_INTERVAL_PER_VEHICLE_IN_SECONDS = 5
+COMMAND_INTERVAL_PER_ACCOUNT_IN_SECONDS = 1
 MQTT_RECONNECT_INTERVAL_IN_SECONDS = 300
+DEFAULT_EVENT_WINDOW_IN_SECONDS = 3
+MAX_PARALLEL_FIRST_REFRESHES = 4
+STORE_SAVE_DELAY_IN_SECONDS = 60
+CLIMATE_BATCH_WINDOW_IN_SECONDS = 1
+ADAPTIVE_POLL_BACKOFF_FACTOR = 4
+ADAPTIVE_POLL_ACTIVE_INTERVAL_IN_MINUTES = 5
+ADAPTIVE_POLL_MAX_INTERVAL_IN_MINUTES = 240
+ADAPTIVE_POLL_EVENT_MAX_AGE_IN_HOURS = 6
 
 # Configuration information
 CONF_USERNAME = "email"
@@ -19,6 +28,14 @@ CONF_REFRESH_TOKEN = "refresh_token"
 CONF_FCM_TOKEN = "fcm_token"
 CONF_TRACING = "tracing"
 CONF_VINLIST = "vins"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_EVENT_WINDOW = "event_window_in_seconds"
+CONF_EVENT_WINDOW_MIN = 0
+CONF_EVENT_WINDOW_MAX = 60
+CONF_OPERATION_HISTORY_SIZE = "operation_history_size"
+CONF_SERVICE_EVENT_HISTORY_SIZE = "service_event_history_size"
+CONF_HISTORY_SIZE_MIN = 1
+CONF_HISTORY_SIZE_MAX = 100
 
 # Queue sizes
 MAX_STORED_OPERATIONS = 2
@@ -28,6 +45,13 @@ MAX_STORED_SERVICE_EVENTS = 2
 OUTSIDE_TEMP_MIN_BOUND = -50
 OUTSIDE_TEMP_MAX_BOUND = 60
 CACHE_CLOCK_SKEW_TOLERANCE_IN_HOURS = 4
+IMAGE_CACHE_SIZE_IN_MB = 20
+IMAGE_MEMORY_CACHE_SIZE_IN_MB = 5
+POSITION_HISTORY_RETENTION_IN_DAYS = 365
 
 # Services / Actions
 SERVICE_SET_PREFERRED_CHARGING_TIME = "set_preferred_charging_time"
+SERVICE_SET_PREFERRED_CHARGING_TIMES = "set_preferred_charging_times"
+SERVICE_SET_AIR_CONDITIONING_SETTINGS = "set_air_conditioning_settings"
+SERVICE_SET_TIMERS = "set_timers"
+SERVICE_GET_POSITION_HISTORY = "get_position_history"
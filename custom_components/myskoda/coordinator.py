@@ -1,70 +1,264 @@
 """Coordinator for the MySkoda integration."""
 
+import asyncio
 import logging
-from collections import OrderedDict, deque
 from collections.abc import Coroutine
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import timedelta
+from enum import StrEnum
+from time import monotonic
 from typing import Callable
 
 from aiohttp import ClientError
 from aiohttp.client_exceptions import ClientResponseError
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.debounce import Debouncer
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.hass_dict import HassKey
 
 from myskoda import MySkoda, Vehicle
+from myskoda.const import DEFAULT_DEBOUNCE_WAIT_SECONDS, OPERATION_REFRESH_DELAY_SECONDS
+from myskoda.models.air_conditioning import AirConditioningState
+from myskoda.models.auxiliary_heating import AuxiliaryState
+from myskoda.models.charging import ChargingState
 from myskoda.models.common import Vin
-from myskoda.models.event import BaseEvent, OperationEvent, ServiceEvent
+from myskoda.models.event import (
+    BaseEvent,
+    OperationEvent,
+    OperationName,
+    OperationStatus,
+    ServiceEvent,
+    ServiceEventName,
+    VehicleEventName,
+)
+from myskoda.models.info import CapabilityId, Info
 from myskoda.models.user import User
+from myskoda.myskoda import UnknownVinError
 
 from .const import (
-    API_COOLDOWN_IN_SECONDS,
+    ADAPTIVE_POLL_ACTIVE_INTERVAL_IN_MINUTES,
+    ADAPTIVE_POLL_BACKOFF_FACTOR,
+    ADAPTIVE_POLL_EVENT_MAX_AGE_IN_HOURS,
+    ADAPTIVE_POLL_MAX_INTERVAL_IN_MINUTES,
+    COMMAND_INTERVAL_PER_VEHICLE_IN_SECONDS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_EVENT_WINDOW,
     CONF_FCM_TOKEN,
+    CONF_OPERATION_HISTORY_SIZE,
     CONF_POLL_INTERVAL,
+    CONF_SERVICE_EVENT_HISTORY_SIZE,
+    DEFAULT_EVENT_WINDOW_IN_SECONDS,
     DEFAULT_FETCH_INTERVAL_IN_MINUTES,
     DOMAIN,
     MAX_STORED_OPERATIONS,
     MAX_STORED_SERVICE_EVENTS,
     MQTT_RECONNECT_INTERVAL_IN_SECONDS,
 )
+from .commands import CommandExecutor, CommandRateLimiter
 from .error_handlers import handle_aiohttp_error
+from .history import OperationHistory, ServiceEventHistory
+from .position_history import PositionHistoryStore
+from .snapshot import (
+    ChargingProfileIndex,
+    EventSection,
+    RenderIndex,
+    Section,
+    VehicleSection,
+    snapshot_user,
+    snapshot_vehicle,
+)
+from .store import MySkodaStore
 
 _LOGGER = logging.getLogger(__name__)
 
-type RefreshFunction = Callable[[], Coroutine[None, None, None]]
+type EventBurstHandler = Callable[
+    [frozenset[Section], frozenset[VehicleSection], bool],
+    Coroutine[None, None, None],
+]
 type MySkodaConfigEntry = ConfigEntry[dict[Vin, MySkodaDataUpdateCoordinator]]
 
+# MySkoda debounces refresh_vehicle once for all vehicles of all accounts: a call
+# within DEFAULT_DEBOUNCE_WAIT_SECONDS of the previous one is postponed, and
+# dropped if yet another call follows. Vehicle refreshes are spaced out further.
+DATA_VEHICLE_REFRESH_LIMITER: HassKey[CommandRateLimiter] = HassKey(
+    f"{DOMAIN}_vehicle_refresh_limiter"
+)
+VEHICLE_REFRESH_INTERVAL_IN_SECONDS = DEFAULT_DEBOUNCE_WAIT_SECONDS + 1
+
+
+@dataclass
+class EventStats:
+    """Counters of the MQTT events received for a vehicle."""
+
+    received: int = 0
+    # Events merged into a burst that was already pending
+    coalesced: int = 0
+    bursts: int = 0
+
+
+class EventCoalescer:
+    """Buffer the MQTT events of a vehicle and handle them in bursts.
 
-class MySkodaDebouncer(Debouncer):
-    """Class to rate limit calls to MySkoda REST APIs."""
+    A car that wakes up sends many events within a few seconds. Events received
+    within `window` seconds of the first one are merged: the sections they
+    changed and the sections they need refetched are combined, so the whole
+    burst results in one refresh and one update of the entities. The update
+    notifications of MySkoda, for the data it refreshes by itself after an
+    event, are merged into the burst the same way.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, func: RefreshFunction, immediate: bool
+        self, hass: HomeAssistant, window: float, handler: EventBurstHandler
     ) -> None:
-        """Initialize debounce."""
-
-        self.immediate = immediate
+        """Create a new event coalescer."""
+        self.hass: HomeAssistant = hass
+        self.window: float = window
+        self.stats: EventStats = EventStats()
+        self._handler: EventBurstHandler = handler
+        self._changed: set[Section] = set()
+        self._refresh: set[VehicleSection] = set()
+        self._delayed: bool = False
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self,
+        changed: frozenset[Section],
+        refresh: frozenset[VehicleSection],
+        delayed: bool = False,
+    ) -> None:
+        """Add an event to the current burst, starting a new burst if needed.
 
-        super().__init__(
-            hass,
-            _LOGGER,
-            cooldown=API_COOLDOWN_IN_SECONDS,
-            immediate=immediate,
-            function=func,
+        `delayed` asks to wait a little longer before refetching, to give the
+        backend time to process a completed operation.
+        """
+        self.stats.received += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.window, self._async_flush
+            )
+        else:
+            self.stats.coalesced += 1
+        self._changed |= changed
+        self._refresh |= refresh
+        self._delayed |= delayed and bool(refresh)
+
+    async def _async_flush(self, _now=None) -> None:
+        """Hand the buffered burst to the handler."""
+        self._unsub_flush = None
+        changed, refresh, delayed = (
+            frozenset(self._changed),
+            frozenset(self._refresh),
+            self._delayed,
         )
+        self._changed.clear()
+        self._refresh.clear()
+        self._delayed = False
+        self.stats.bursts += 1
+        _LOGGER.debug("Handling burst of MQTT events, totals: %s", self.stats)
+        await self._handler(changed, refresh, delayed)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the pending burst."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+
+# Vehicle sections to refetch after MQTT events which the MySkoda library does not
+# refresh by itself. Events already handled by the library are left out, so their
+# data is not fetched twice. Every section needs a matching `get_<section>`
+# method on MySkoda, each of which costs a single request.
+EVENT_REFRESH_SECTIONS: dict[StrEnum, frozenset[VehicleSection]] = {
+    ServiceEventName.CHANGE_LIGHTS: frozenset({VehicleSection.STATUS}),
+    VehicleEventName.VEHICLE_IGNITION_STATUS_CHANGED: frozenset(
+        {VehicleSection.POSITIONS, VehicleSection.DRIVING_RANGE}
+    ),
+    OperationName.SET_AIR_CONDITIONING_AT_UNLOCK: frozenset(
+        {VehicleSection.AIR_CONDITIONING}
+    ),
+    OperationName.SET_AIR_CONDITIONING_SEATS_HEATING: frozenset(
+        {VehicleSection.AIR_CONDITIONING}
+    ),
+    OperationName.SET_AIR_CONDITIONING_WITHOUT_EXTERNAL_POWER: frozenset(
+        {VehicleSection.AIR_CONDITIONING}
+    ),
+    OperationName.SET_CLIMATE_PLANS: frozenset({VehicleSection.AIR_CONDITIONING}),
+    OperationName.START_ACTIVE_VENTILATION: frozenset(
+        {VehicleSection.AIR_CONDITIONING}
+    ),
+    OperationName.STOP_ACTIVE_VENTILATION: frozenset({VehicleSection.AIR_CONDITIONING}),
+    OperationName.UPDATE_TARGET_TEMPERATURE: frozenset(
+        {VehicleSection.AIR_CONDITIONING}
+    ),
+    OperationName.WINDOWS_HEATING: frozenset({VehicleSection.AIR_CONDITIONING}),
+    OperationName.START_STOP_CHARGING: frozenset({VehicleSection.CHARGING}),
+    OperationName.UPDATE_BATTERY_SUPPORT: frozenset({VehicleSection.CHARGING}),
+    OperationName.UPDATE_CHARGE_MODE: frozenset({VehicleSection.CHARGING}),
+    OperationName.UPDATE_MINIMAL_SOC: frozenset({VehicleSection.CHARGING_PROFILES}),
+}
+
+# Vehicle sections the position of the vehicle is taken from, see vehicle_position.
+POSITION_SECTIONS = frozenset(
+    {VehicleSection.POSITIONS, VehicleSection.PARKING_POSITION}
+)
+
 
+def poll_interval(entry: MySkodaConfigEntry) -> timedelta:
+    """Return the configured interval between scheduled refreshes."""
+    return timedelta(
+        minutes=entry.options.get(CONF_POLL_INTERVAL, DEFAULT_FETCH_INTERVAL_IN_MINUTES)
+    )
 
-# History of EventType.OPERATION events, keyed by request_id
-Operations = OrderedDict[str, OperationEvent]
 
+class UserRefreshManager:
+    """Refresh the user once per poll cycle for all coordinators of a config entry.
 
-# History of EventType.SERVICE_EVENT events
-ServiceEvents = deque[ServiceEvent]
+    All vehicles of an account share one MySkoda client, so there is no need
+    to fetch the user for every vehicle. Concurrent callers wait for the same
+    request. After a success the library serves the user from its cache, but
+    a failed request is not cached there, so callers within the same poll
+    cycle reuse the failure instead of repeating a rate-limited request for
+    every vehicle.
+    """
+
+    def __init__(self, myskoda: MySkoda, poll_interval: timedelta) -> None:
+        """Create a new user refresh manager."""
+        self.myskoda: MySkoda = myskoda
+        # Coordinators of one entry poll at the same interval, but not at the
+        # same instant. Half an interval separates two cycles reliably.
+        self._max_age: float = poll_interval.total_seconds() / 2
+        self._lock = asyncio.Lock()
+        self._failed_at: float | None = None
+        self._error: ClientError | None = None
+
+    async def async_refresh(self) -> User | None:
+        """Refresh the user unless that already failed during this cycle.
+
+        Raises UpdateFailed, caused by the error of the request.
+        """
+        async with self._lock:
+            if (
+                self._failed_at is None
+                or monotonic() - self._failed_at >= self._max_age
+            ):
+                self._failed_at = self._error = None
+                try:
+                    await self.myskoda.refresh_user()
+                except ClientError as err:
+                    self._failed_at = monotonic()
+                    self._error = err
+            else:
+                _LOGGER.debug("Reusing failed user refresh of the current poll cycle")
+
+            if self._error is not None:
+                raise UpdateFailed(
+                    f"Error getting user data from MySkoda API: {self._error}"
+                ) from self._error
+            return self.myskoda.user
 
 
 @dataclass
@@ -76,13 +270,18 @@ class Config:
 
 @dataclass
 class State:
-    """Data managed by the coordinator."""
+    """Data managed by the coordinator.
+
+    `generation` is bumped every time the vehicle or user snapshot changes, so
+    consumers can detect changes without relying on object identity.
+    """
 
     vehicle: Vehicle
     user: User
     config: Config
-    operations: Operations
-    service_events: ServiceEvents
+    operations: OperationHistory
+    service_events: ServiceEventHistory
+    generation: int = 0
 
 
 class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
@@ -94,7 +293,15 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
     data: State
 
     def __init__(
-        self, hass: HomeAssistant, entry: MySkodaConfigEntry, myskoda: MySkoda, vin: str
+        self,
+        hass: HomeAssistant,
+        entry: MySkodaConfigEntry,
+        myskoda: MySkoda,
+        vin: str,
+        user_refresher: UserRefreshManager,
+        store: MySkodaStore,
+        positions: PositionHistoryStore,
+        command_limiter: CommandRateLimiter,
     ) -> None:
         """Create a new coordinator."""
 
@@ -102,24 +309,51 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(
-                minutes=entry.options.get(
-                    CONF_POLL_INTERVAL, DEFAULT_FETCH_INTERVAL_IN_MINUTES
-                )
-            ),
+            update_interval=poll_interval(entry),
             always_update=False,
         )
         self.hass: HomeAssistant = hass
         self.vin: str = vin
         self.myskoda: MySkoda = myskoda
+        self.user_refresher: UserRefreshManager = user_refresher
+        self.store: MySkodaStore = store
+        self.positions: PositionHistoryStore = positions
         self.myskoda.subscribe_updates(vin, self._on_myskoda_update)
-        self.operations: OrderedDict = OrderedDict()
-        self.service_events: deque = deque(maxlen=MAX_STORED_SERVICE_EVENTS)
+        self.operations: OperationHistory = OperationHistory(
+            entry.options.get(CONF_OPERATION_HISTORY_SIZE, MAX_STORED_OPERATIONS)
+        )
+        self._charging_profile_index: ChargingProfileIndex = ChargingProfileIndex()
+        self._render_index: RenderIndex = RenderIndex()
+        self._capabilities_source: Info | None = None
+        self._capabilities: frozenset[CapabilityId] = frozenset()
+        self.service_events: ServiceEventHistory = ServiceEventHistory(
+            entry.options.get(
+                CONF_SERVICE_EVENT_HISTORY_SIZE, MAX_STORED_SERVICE_EVENTS
+            )
+        )
         self.entry: MySkodaConfigEntry = entry
         self._mqtt_connecting: bool = False
         self._mqtt_retry_attempts: int = 0
         self._mqtt_retry_scheduled: bool = False
+        # Monotonic time of the last MQTT event received, see _update_poll_interval
+        self._last_event_received: float | None = None
         self._startup_called: bool = False
+        self._restored: bool = False
+        self._refresh_limiter: CommandRateLimiter = hass.data.setdefault(
+            DATA_VEHICLE_REFRESH_LIMITER,
+            CommandRateLimiter(VEHICLE_REFRESH_INTERVAL_IN_SECONDS),
+        )
+        self.commands: CommandExecutor = CommandExecutor(
+            hass, vin, command_limiter, COMMAND_INTERVAL_PER_VEHICLE_IN_SECONDS
+        )
+        self.event_coalescer: EventCoalescer = EventCoalescer(
+            hass,
+            entry.options.get(CONF_EVENT_WINDOW, DEFAULT_EVENT_WINDOW_IN_SECONDS),
+            self._async_handle_event_burst,
+        )
+        # Sections changed by the update currently being pushed to listeners.
+        # None means that every entity should refresh its state.
+        self.changed_sections: frozenset[Section] | None = None
 
     def _save_fcm_token(self) -> None:
         """Persist the current FCM token if it changed."""
@@ -161,43 +395,147 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
         if self.myskoda.mqtt:
             self._mqtt_retry_attempts = 0
             self._save_fcm_token()
-            return
+        else:
+            self._schedule_mqtt_retry()
+
+        self._update_poll_interval(self.data.vehicle)
+        self._async_set_updated_sections(frozenset())
+
+    def _is_active(self, vehicle: Vehicle) -> bool:
+        """Check if the vehicle is charging or climatising."""
+        charging = vehicle.charging and vehicle.charging.status
+        ac = vehicle.air_conditioning
+        aux = vehicle.auxiliary_heating
+        return bool(
+            (charging and charging.state == ChargingState.CHARGING)
+            or (
+                ac
+                and ac.state
+                not in (AirConditioningState.OFF, AirConditioningState.INVALID)
+            )
+            or (
+                aux
+                and aux.state
+                not in (
+                    None,
+                    AuxiliaryState.OFF,
+                    AuxiliaryState.INVALID,
+                    AuxiliaryState.UNSUPPORTED,
+                )
+            )
+        )
+
+    def _events_recent(self) -> bool:
+        """Check if an MQTT event was received within the last few hours."""
+        if self._last_event_received is None:
+            return False
+        max_age = timedelta(hours=ADAPTIVE_POLL_EVENT_MAX_AGE_IN_HOURS)
+        return monotonic() - self._last_event_received < max_age.total_seconds()
+
+    def _update_poll_interval(self, vehicle: Vehicle) -> None:
+        """Adapt the interval between scheduled refreshes, if enabled in the options.
+
+        Polling tightens while the vehicle is charging or climatising, and backs
+        off while MQTT delivers events, because changes are pushed by events. A
+        connected broker may have stopped delivering, so there is no back-off
+        when no event was received for a while. Without MQTT the configured
+        interval is used.
+        """
+        interval = poll_interval(self.entry)
+        if (
+            self.entry.options.get(CONF_ADAPTIVE_POLLING)
+            and self.myskoda.mqtt
+            and not self._mqtt_retry_scheduled
+        ):
+            if self._is_active(vehicle):
+                interval = min(
+                    interval,
+                    timedelta(minutes=ADAPTIVE_POLL_ACTIVE_INTERVAL_IN_MINUTES),
+                )
+            elif self._events_recent():
+                interval = min(
+                    interval * ADAPTIVE_POLL_BACKOFF_FACTOR,
+                    max(
+                        interval,
+                        timedelta(minutes=ADAPTIVE_POLL_MAX_INTERVAL_IN_MINUTES),
+                    ),
+                )
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Polling vin %s every %s", self.vin, interval)
+            self.update_interval = interval
+
+    def _async_schedule_post_start(self) -> None:
+        """Connect to MQTT once Home Assistant has finished starting up."""
+
+        async def _async_finish_startup(hass: HomeAssistant) -> None:
+            """Tasks to execute when we have finished starting up."""
+            _LOGGER.debug(
+                "MySkoda has finished starting up. Scheduling post-start tasks for vin %s.",
+                self.vin,
+            )
+
+            if not self.myskoda.mqtt and not self._mqtt_connecting:
+                self.entry.async_create_background_task(
+                    self.hass, self._async_retry_mqtt_connect(), "mqtt"
+                )
+
+        async_at_started(
+            hass=self.hass, at_start_cb=_async_finish_startup
+        )  # Schedule post-setup tasks
+
+    @callback
+    def async_restore(self, user: User, vehicle: Vehicle) -> None:
+        """Start from data cached on disk.
 
-        self._schedule_mqtt_retry()
+        This replaces the initial data fetch, so setup does not have to wait
+        for the MySkoda API. Live data is fetched afterwards by async_refresh,
+        which setup runs for all restored vehicles one after another.
+        """
+        _LOGGER.debug("Restoring cached data for vin %s", self.vin)
+        self._restored = True
+        self.async_set_updated_data(
+            State(vehicle, user, Config(), self.operations, self.service_events)
+        )
+        self._async_schedule_post_start()
 
     async def _async_update_data(self) -> State:
         """Called by parent class during setup and scheduled refresh."""
         config = self.data.config if self.data and self.data.config else Config()
 
-        if self.entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
+        if (
+            self.entry.state == ConfigEntryState.SETUP_IN_PROGRESS
+            and not self._restored
+        ):
             if getattr(self, "_startup_called", False):
                 return self.data  # Prevent duplicate execution
             _LOGGER.debug("Performing initial data fetch for vin %s", self.vin)
             try:
-                user = await self.myskoda.get_user()
-                vehicle = await self.myskoda.get_partial_vehicle(self.vin, [])
+                if (live_user := await self.user_refresher.async_refresh()) is None:
+                    raise UpdateFailed("No user data received during setup")
+                user = snapshot_user(live_user, None)
+                vehicle, _ = snapshot_vehicle(
+                    await self.myskoda.get_partial_vehicle(self.vin, []), None
+                )
                 self._startup_called = True  # Prevent duplicate execution
+            except UpdateFailed as err:
+                # Failed user refreshes are raised as UpdateFailed from the request error
+                if isinstance(err.__cause__, ClientResponseError):
+                    handle_aiohttp_error(
+                        "setup user", err.__cause__, self.hass, self.entry
+                    )
+                raise
             except ClientResponseError as err:
                 handle_aiohttp_error(
                     "setup user and vehicle", err, self.hass, self.entry
                 )
                 raise UpdateFailed("Failed to retrieve initial data during setup")
 
-            async def _async_finish_startup(hass: HomeAssistant) -> None:
-                """Tasks to execute when we have finished starting up."""
-                _LOGGER.debug(
-                    "MySkoda has finished starting up. Scheduling post-start tasks for vin %s.",
-                    self.vin,
-                )
-
-                if not self.myskoda.mqtt and not self._mqtt_connecting:
-                    self.entry.async_create_background_task(
-                        self.hass, self._async_retry_mqtt_connect(), "mqtt"
-                    )
-
-            async_at_started(
-                hass=self.hass, at_start_cb=_async_finish_startup
-            )  # Schedule post-setup tasks
+            self._async_schedule_post_start()
+            self._update_poll_interval(vehicle)
+            self.store.update_user(user)
+            self.store.update_vehicle(self.vin, vehicle, frozenset(VehicleSection))
+            self.positions.record(self.vin, vehicle)
             return State(
                 vehicle,
                 user,
@@ -211,15 +549,16 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
 
         # Refresh user data. This is allowed to fail if we already have this in state.
         try:
-            await self.myskoda.refresh_user()
-        except ClientResponseError as err:
-            handle_aiohttp_error("user", err, self.hass, self.entry)
+            await self.user_refresher.async_refresh()
+        except UpdateFailed as err:
+            if isinstance(err.__cause__, ClientResponseError):
+                handle_aiohttp_error("user", err.__cause__, self.hass, self.entry)
             if not self.data.user:
-                raise UpdateFailed(
-                    f"Error getting user data from MySkoda API: {err}"
-                ) from err
+                raise
 
-        # Refresh vehicle data.
+        # Refresh vehicle data. Refreshes of all vehicles go through the library
+        # one at a time, so none of them is swallowed by its debounce.
+        await self._refresh_limiter.async_wait()
         try:
             await self.myskoda.refresh_vehicle(self.vin)
         except ClientResponseError as err:
@@ -227,24 +566,91 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
         except ClientError as err:
             raise UpdateFailed(f"Error getting update from MySkoda API: {err}") from err
 
+        self._update_poll_interval(self.data.vehicle)
         return State(
             self.data.vehicle,
             self.data.user,
             self.data.config,
             self.operations,
             self.service_events,
+            self.data.generation,
         )
 
+    @property
+    def charging_profile_index(self) -> ChargingProfileIndex:
+        """Return the index of the charging profiles of the current snapshot.
+
+        Snapshots only replace the sections that changed, so the index is
+        rebuilt only when the charging profiles actually changed.
+        """
+        profiles = self.data.vehicle.charging_profiles
+        if self._charging_profile_index.source is not profiles:
+            self._charging_profile_index = ChargingProfileIndex.build(profiles)
+        return self._charging_profile_index
+
+    @property
+    def render_index(self) -> RenderIndex:
+        """Return the render URLs of the current snapshot.
+
+        Rebuilt only when the vehicle info changed, see charging_profile_index.
+        """
+        info = self.data.vehicle.info
+        if self._render_index.source is not info:
+            self._render_index = RenderIndex.build(info)
+        return self._render_index
+
+    @property
+    def capabilities(self) -> frozenset[CapabilityId]:
+        """Return the capabilities of the vehicle in the current snapshot."""
+        info = self.data.vehicle.info
+        if self._capabilities_source is not info:
+            self._capabilities_source = info
+            self._capabilities = frozenset(
+                capability.id for capability in info.capabilities.capabilities
+            )
+        return self._capabilities
+
     async def _on_myskoda_update(self, vin: str) -> None:
-        """Trigger an update of all HA entities when User or Vehicle change.
+        """Trigger an update of the HA entities when User or Vehicle change.
 
-        Always pass in a copy of the object to force an update.
+        MySkoda refreshes data by itself after some MQTT events and notifies for
+        each refresh. The snapshot is taken right away, the entities are updated
+        together with the rest of the burst by the event coalescer.
         """
         _LOGGER.debug("Received update notification for %s", self.vin)
-        if user := deepcopy(self.myskoda.user):
+        self.event_coalescer.async_add(self._take_snapshot(), frozenset())
+
+    def _take_snapshot(self) -> frozenset[VehicleSection]:
+        """Snapshot the user and vehicle kept by MySkoda, return the changed sections.
+
+        Only the sections that changed are copied into the new snapshot, the
+        rest is shared with the previous one.
+        """
+        user = snapshot_user(self.myskoda.user, self.data.user)
+        vehicle, changed = snapshot_vehicle(
+            self.myskoda.vehicle(self.vin), self.data.vehicle
+        )
+        if changed or user is not self.data.user:
+            _LOGGER.debug("Sections changed for %s: %s", self.vin, sorted(changed))
+            if user is not self.data.user:
+                self.store.update_user(user)
+            self.store.update_vehicle(self.vin, vehicle, changed)
+            if not changed.isdisjoint(POSITION_SECTIONS):
+                self.positions.record(self.vin, vehicle)
             self.data.user = user
-        self.data.vehicle = deepcopy(self.myskoda.vehicle(self.vin))
-        self.async_set_updated_data(self.data)
+            self.data.vehicle = vehicle
+            self.data.generation += 1
+        self._update_poll_interval(vehicle)
+        return changed
+
+    @callback
+    def _async_set_updated_sections(self, sections: frozenset[Section]) -> None:
+        """Push the current state to the entities that read any of `sections`."""
+        self.changed_sections = sections
+        try:
+            self.async_set_updated_data(self.data)
+        finally:
+            self.changed_sections = None
 
     async def _mqtt_connect(self) -> None:
         """Connect to MQTT and handle internals."""
@@ -259,17 +665,84 @@ class MySkodaDataUpdateCoordinator(DataUpdateCoordinator[State]):
         self._mqtt_connecting = False
 
     async def _on_mqtt_event(self, event: BaseEvent) -> None:
+        # Events of any vehicle of the account show that MQTT is delivering.
+        self._last_event_received = monotonic()
         if event.vin != self.vin:
             return
+        changed: set[Section] = set()
         if isinstance(event, OperationEvent):
-            # Store the last MAX_STORED_OPERATIONS operations
-            if request_id := event.request_id:
-                self.operations[request_id] = event
-                while len(self.operations) > MAX_STORED_OPERATIONS:
-                    self.operations.popitem(last=False)
+            if event.request_id:
+                self.operations.add(event)
+                changed.add(EventSection.OPERATIONS)
         if isinstance(event, ServiceEvent):
-            self.service_events.appendleft(event)
-        self.async_set_updated_data(self.data)
+            self.service_events.add(event)
+            changed.add(EventSection.SERVICE_EVENTS)
+        self.event_coalescer.async_add(
+            frozenset(changed),
+            self._refresh_sections_for_event(event),
+            delayed=isinstance(event, OperationEvent),
+        )
+
+    def _refresh_sections_for_event(
+        self, event: BaseEvent
+    ) -> frozenset[VehicleSection]:
+        """Return the vehicle sections to refetch after an event.
+
+        See EVENT_REFRESH_SECTIONS for the sections refetched for each event.
+        """
+        if isinstance(event, OperationEvent):
+            if event.status in (OperationStatus.IN_PROGRESS, OperationStatus.ERROR):
+                return frozenset()
+            name = event.operation
+        else:
+            name = getattr(event, "name", None)
+            if name is None:
+                return frozenset()
+        return EVENT_REFRESH_SECTIONS.get(name, frozenset())
+
+    async def _async_handle_event_burst(
+        self,
+        changed: frozenset[Section],
+        refresh: frozenset[VehicleSection],
+        delayed: bool,
+    ) -> None:
+        """Refetch the sections needed by a burst of events and push the result once.
+
+        The sections are fetched with the `get_*` calls of MySkoda rather than its
+        `refresh_*` calls. Those are debounced across all vehicles, and a call
+        within the debounce window runs later without notifying, after the
+        snapshot below has already been taken.
+        """
+        try:
+            vehicle: Vehicle | None = self.myskoda.vehicle(self.vin)
+        except UnknownVinError:
+            vehicle = None  # The initial refresh is still running
+
+        if refresh and vehicle:
+            if delayed:
+                # The backend is not updated right away when an operation completes
+                await asyncio.sleep(
+                    max(
+                        0, OPERATION_REFRESH_DELAY_SECONDS - self.event_coalescer.window
+                    )
+                )
+            _LOGGER.debug("Refreshing %s for vin %s", sorted(refresh), self.vin)
+            try:
+                for section in refresh:
+                    value = await getattr(self.myskoda, f"get_{section}")(self.vin)
+                    # Use the update method of the vehicle where there is one, it
+                    # keeps the current data if the car didn't capture anything new.
+                    if update := getattr(vehicle, f"update_{section}", None):
+                        update(value)
+                    else:
+                        setattr(vehicle, section, value)
+            except ClientError as err:
+                _LOGGER.warning(
+                    "Error refreshing %s for vin %s: %s", sorted(refresh), self.vin, err
+                )
+            changed |= self._take_snapshot()
+
+        self._async_set_updated_sections(changed)
 
     def _unsub_refresh(self):
         return
@@ -1,18 +1,49 @@
 """Actions (services) for the MySkoda integration."""
 
+import asyncio
 import logging
+from collections.abc import Coroutine, Hashable, Sequence
+from dataclasses import replace
+from typing import Any
 
 import voluptuous as vol
 from aiohttp import ClientResponseError
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
+from myskoda.models.air_conditioning import (
+    AirConditioningAtUnlock,
+    AirConditioningTimer,
+    AirConditioningWithoutExternalPower,
+    SeatHeating,
+    TimerMode,
+    WindowHeating,
+)
 from myskoda.models.chargingprofiles import ChargingProfile, ChargingTimes
+from myskoda.models.common import Weekday
+from myskoda.models.departure import DepartureTimer
+from myskoda.models.info import CapabilityId
 from myskoda.mqtt import OperationFailedError
 
-from .const import CONF_READONLY, DOMAIN, SERVICE_SET_PREFERRED_CHARGING_TIME
+from .const import (
+    CONF_READONLY,
+    DOMAIN,
+    SERVICE_GET_POSITION_HISTORY,
+    SERVICE_SET_AIR_CONDITIONING_SETTINGS,
+    SERVICE_SET_PREFERRED_CHARGING_TIME,
+    SERVICE_SET_PREFERRED_CHARGING_TIMES,
+    SERVICE_SET_TIMERS,
+)
 from .coordinator import MySkodaDataUpdateCoordinator
+from .device_index import DATA_DEVICE_INDEX
+from .entity import Timer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,57 +57,95 @@ SERVICE_SET_PREFERRED_CHARGING_TIME_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_SET_PREFERRED_CHARGING_TIMES_SCHEMA = vol.Schema(
+    {
+        vol.Required("charging_times"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [SERVICE_SET_PREFERRED_CHARGING_TIME_SCHEMA],
+        ),
+    }
+)
 
-def _resolve_charging_profile(
-    hass: HomeAssistant, device_id: str
-) -> tuple[MySkodaDataUpdateCoordinator, ChargingProfile] | None:
-    """Resolve a charging-profile device_id to its coordinator and ChargingProfile.
+SERVICE_SET_AIR_CONDITIONING_SETTINGS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("device_id"): cv.string,
+            vol.Optional("seat_heating_front_left"): cv.boolean,
+            vol.Optional("seat_heating_front_right"): cv.boolean,
+            vol.Optional("window_heating"): cv.boolean,
+            vol.Optional("ac_at_unlock"): cv.boolean,
+            vol.Optional("ac_without_external_power"): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(
+        "seat_heating_front_left",
+        "seat_heating_front_right",
+        "window_heating",
+        "ac_at_unlock",
+        "ac_without_external_power",
+    ),
+)
 
-    Only accepts devices created for a charging profile (children of a vehicle
-    device via `via_device`), not the vehicle device itself.
-    """
-    device_registry = dr.async_get(hass)
-    device = device_registry.async_get(device_id)
-    if not device or not device.via_device_id:
-        return None
-
-    vehicle_device = device_registry.async_get(device.via_device_id)
-    if not vehicle_device:
-        return None
-
-    vin = next(
-        (
-            identifier
-            for domain, identifier in vehicle_device.identifiers
-            if domain == DOMAIN
+TIMER_SCHEMA = vol.Schema(
+    {
+        vol.Required("id"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("enabled"): cv.boolean,
+        vol.Optional("time"): cv.time,
+        vol.Optional("type"): vol.All(cv.string, vol.Upper, vol.Coerce(TimerMode)),
+        vol.Optional("days"): vol.All(
+            cv.ensure_list, [vol.All(cv.string, vol.Upper, vol.Coerce(Weekday))]
         ),
-        None,
-    )
-    if not vin:
-        return None
+    }
+)
 
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        coordinators = getattr(entry, "runtime_data", None)
-        coordinator = coordinators.get(vin) if coordinators else None
-        if not coordinator or not coordinator.data:
-            continue
+DEPARTURE_TIMER_SCHEMA = TIMER_SCHEMA.extend(
+    {
+        vol.Optional("charging"): cv.boolean,
+        vol.Optional("climatisation"): cv.boolean,
+    }
+)
 
-        profiles = coordinator.data.vehicle.charging_profiles
-        if not profiles:
-            continue
+SERVICE_SET_TIMERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("device_id"): cv.string,
+            vol.Optional("departure_timers"): vol.All(
+                cv.ensure_list, [DEPARTURE_TIMER_SCHEMA]
+            ),
+            vol.Optional("ac_timers"): vol.All(cv.ensure_list, [TIMER_SCHEMA]),
+        }
+    ),
+    cv.has_at_least_one_key("departure_timers", "ac_timers"),
+)
 
-        for profile in profiles.charging_profiles:
-            expected_identifier = (DOMAIN, f"{vin}_charging_profile_{profile.id}")
-            if expected_identifier in device.identifiers:
-                return coordinator, profile
+SERVICE_GET_POSITION_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+    }
+)
 
-    return None
 
+def _resolve_charging_time(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    resolved_profiles: dict[
+        str, tuple[MySkodaDataUpdateCoordinator, ChargingProfile] | None
+    ],
+) -> tuple[MySkodaDataUpdateCoordinator, ChargingProfile, ChargingTimes]:
+    """Validate one preferred charging time and build its ChargingTimes.
 
-async def _async_handle_set_preferred_charging_time(call: ServiceCall) -> None:
-    """Handle the set_preferred_charging_time action."""
-    resolved = _resolve_charging_profile(call.hass, call.data["device_id"])
-    if not resolved:
+    Devices are resolved once and kept in `resolved_profiles`, so a batch
+    touching the same profile several times looks it up only once.
+    """
+    device_id = data["device_id"]
+    if device_id not in resolved_profiles:
+        resolved_profiles[device_id] = hass.data[
+            DATA_DEVICE_INDEX
+        ].resolve_charging_profile(device_id)
+    if not (resolved := resolved_profiles[device_id]):
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="charging_profile_not_found",
@@ -89,7 +158,7 @@ async def _async_handle_set_preferred_charging_time(call: ServiceCall) -> None:
             translation_key="readonly_mode",
         )
 
-    times_id = call.data["id"]
+    times_id = data["id"]
     if not any(times.id == times_id for times in profile.preferred_charging_times):
         raise ServiceValidationError(
             translation_domain=DOMAIN,
@@ -98,14 +167,24 @@ async def _async_handle_set_preferred_charging_time(call: ServiceCall) -> None:
 
     times = ChargingTimes(
         id=times_id,
-        enabled=call.data["enabled"],
-        start_time=call.data["start_time"],
-        end_time=call.data["end_time"],
+        enabled=data["enabled"],
+        start_time=data["start_time"],
+        end_time=data["end_time"],
     )
+    return coordinator, profile, times
+
+
+async def _async_handle_set_preferred_charging_time(call: ServiceCall) -> None:
+    """Handle the set_preferred_charging_time action."""
+    coordinator, profile, times = _resolve_charging_time(call.hass, call.data, {})
+    times_id = times.id
 
     try:
-        await coordinator.myskoda.set_preferred_charging_times(
-            coordinator.vin, profile.id, times
+        await coordinator.commands.async_execute(
+            ("preferred_charging_time", profile.id, times_id),
+            coordinator.myskoda.set_preferred_charging_times(
+                coordinator.vin, profile.id, times
+            ),
         )
     except (ClientResponseError, OperationFailedError) as exc:
         _LOGGER.error("Failed to set charging profile time: %s", exc)
@@ -115,12 +194,295 @@ async def _async_handle_set_preferred_charging_time(call: ServiceCall) -> None:
         ) from exc
 
 
+async def _async_handle_set_preferred_charging_times(call: ServiceCall) -> None:
+    """Handle the set_preferred_charging_times action.
+
+    Entries are validated up front and grouped per vehicle and profile, so
+    nothing is sent if any of them is invalid. All windows of a profile are
+    applied to the profile known to the coordinator and written with a single
+    request. Profiles already at the requested value are skipped, and when a
+    window is listed more than once the last entry wins.
+    """
+    resolved_profiles: dict[
+        str, tuple[MySkodaDataUpdateCoordinator, ChargingProfile] | None
+    ] = {}
+    coordinators: dict[str, MySkodaDataUpdateCoordinator] = {}
+    requested: dict[str, dict[int, dict[int, ChargingTimes]]] = {}
+    for data in call.data["charging_times"]:
+        coordinator, profile, times = _resolve_charging_time(
+            call.hass, data, resolved_profiles
+        )
+        coordinators[coordinator.vin] = coordinator
+        requested.setdefault(coordinator.vin, {}).setdefault(profile.id, {})[
+            times.id
+        ] = times
+
+    executions = []
+    for vin, times_by_profile in requested.items():
+        coordinator = coordinators[vin]
+        profiles = coordinator.charging_profile_index.profiles
+        commands: dict[Hashable, Coroutine[Any, Any, None]] = {}
+        for profile_id, times_by_id in times_by_profile.items():
+            profile = profiles[profile_id]
+            updated = replace(
+                profile,
+                preferred_charging_times=[
+                    times_by_id.get(times.id, times)
+                    for times in profile.preferred_charging_times
+                ],
+            )
+            if updated != profile:
+                commands[("charging_profile", profile_id)] = (
+                    coordinator.myskoda.rest_api.set_charging_profile(vin, updated)
+                )
+        if commands:
+            executions.append(
+                _async_execute_all(coordinator, commands, "charging_time_update_failed")
+            )
+
+    if not executions:
+        _LOGGER.debug("Preferred charging times already up to date")
+        return
+
+    # Vehicles have their own command queues, so update them concurrently.
+    results = await asyncio.gather(*executions, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def _air_conditioning_settings_commands(
+    coordinator: MySkodaDataUpdateCoordinator, data: dict[str, Any]
+) -> dict[str, Coroutine[Any, Any, None]]:
+    """Build one command per settings request that needs to change.
+
+    The API has a separate request per group of settings, so both seats share
+    one request. Settings that already have the requested value are skipped.
+    """
+    myskoda, vin = coordinator.myskoda, coordinator.vin
+    ac = coordinator.data.vehicle.air_conditioning
+    seats = ac.seat_heating_activated if ac else None
+    commands: dict[str, Coroutine[Any, Any, None]] = {}
+
+    seat_heating = SeatHeating(
+        front_left=data.get("seat_heating_front_left"),
+        front_right=data.get("seat_heating_front_right"),
+    )
+    if seats is not None:
+        if seat_heating.front_left == seats.front_left:
+            seat_heating.front_left = None
+        if seat_heating.front_right == seats.front_right:
+            seat_heating.front_right = None
+    if seat_heating.front_left is not None or seat_heating.front_right is not None:
+        commands["seats_heating"] = myskoda.set_seats_heating(vin, seat_heating)
+
+    if (enabled := data.get("window_heating")) is not None and (
+        not ac or ac.window_heating_enabled != enabled
+    ):
+        commands["windows_heating"] = myskoda.set_windows_heating(
+            vin, WindowHeating(window_heating_enabled=enabled)
+        )
+
+    if (enabled := data.get("ac_at_unlock")) is not None and (
+        not ac or ac.air_conditioning_at_unlock != enabled
+    ):
+        commands["ac_at_unlock"] = myskoda.set_ac_at_unlock(
+            vin, AirConditioningAtUnlock(air_conditioning_at_unlock_enabled=enabled)
+        )
+
+    if (enabled := data.get("ac_without_external_power")) is not None and (
+        not ac or ac.air_conditioning_without_external_power != enabled
+    ):
+        commands["ac_without_external_power"] = myskoda.set_ac_without_external_power(
+            vin,
+            AirConditioningWithoutExternalPower(
+                air_conditioning_without_external_power_enabled=enabled
+            ),
+        )
+
+    return commands
+
+
+def _resolve_vehicle(call: ServiceCall) -> MySkodaDataUpdateCoordinator:
+    """Resolve the vehicle targeted by an action."""
+    index = call.hass.data[DATA_DEVICE_INDEX]
+    coordinator = index.resolve_vehicle(call.data["device_id"])
+    if not coordinator:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="vehicle_not_found",
+        )
+    return coordinator
+
+
+def _resolve_writable_vehicle(call: ServiceCall) -> MySkodaDataUpdateCoordinator:
+    """Resolve the vehicle targeted by an action that sends commands."""
+    coordinator = _resolve_vehicle(call)
+    if coordinator.entry.options.get(CONF_READONLY):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="readonly_mode",
+        )
+    return coordinator
+
+
+async def _async_execute_all(
+    coordinator: MySkodaDataUpdateCoordinator,
+    commands: dict[Hashable, Coroutine[Any, Any, None]],
+    failed_translation_key: str,
+) -> None:
+    """Queue all commands at once, so they are sent back to back.
+
+    Raises HomeAssistantError once all commands are done if any of them failed.
+    """
+    results = await asyncio.gather(
+        *(
+            coordinator.commands.async_execute(key, command)
+            for key, command in commands.items()
+        ),
+        return_exceptions=True,
+    )
+    failed = False
+    for key, result in zip(commands, results):
+        if isinstance(result, (ClientResponseError, OperationFailedError)):
+            _LOGGER.error("Failed to set %s: %s", key, result)
+            failed = True
+        elif isinstance(result, BaseException):
+            raise result
+    if failed:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key=failed_translation_key,
+        )
+
+
+async def _async_handle_set_air_conditioning_settings(call: ServiceCall) -> None:
+    """Handle the set_air_conditioning_settings action."""
+    coordinator = _resolve_writable_vehicle(call)
+
+    capabilities = coordinator.capabilities
+    if (
+        "ac_without_external_power" in call.data
+        and CapabilityId.AIR_CONDITIONING_HEATING_SOURCE_ELECTRIC not in capabilities
+    ) or (
+        call.data.keys() - {"device_id", "ac_without_external_power"}
+        and CapabilityId.AIR_CONDITIONING_SMART_SETTINGS not in capabilities
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="air_conditioning_setting_not_supported",
+        )
+
+    commands = _air_conditioning_settings_commands(coordinator, call.data)
+    if not commands:
+        _LOGGER.debug("Air conditioning settings already up to date")
+        return
+
+    await _async_execute_all(
+        coordinator,
+        {("air_conditioning_settings", key): cmd for key, cmd in commands.items()},
+        "air_conditioning_settings_update_failed",
+    )
+
+
+def _updated_timers[T: Timer](
+    timers: Sequence[T], requested: list[dict[str, Any]], days_field: str
+) -> list[T]:
+    """Apply the requested changes to copies of the timers.
+
+    Returns only the timers that differ from the current ones. A timer listed
+    more than once gets the changes of all entries, later ones winning.
+    """
+    current = {timer.id: timer for timer in timers}
+    updated: dict[int, T] = {}
+    for changes in requested:
+        timer_id = changes["id"]
+        if (timer := updated.get(timer_id, current.get(timer_id))) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="timer_not_found",
+                translation_placeholders={"id": str(timer_id)},
+            )
+        fields = {k: v for k, v in changes.items() if k not in ("id", "days")}
+        if "days" in changes:
+            fields[days_field] = changes["days"]
+        updated[timer_id] = replace(timer, **fields)
+    return [timer for timer in updated.values() if timer != current[timer.id]]
+
+
+async def _async_handle_set_timers(call: ServiceCall) -> None:
+    """Handle the set_timers action.
+
+    All requested timers are validated before any command is created, so an
+    invalid entry leaves no command behind.
+    """
+    coordinator = _resolve_writable_vehicle(call)
+    myskoda, vin = coordinator.myskoda, coordinator.vin
+    vehicle = coordinator.data.vehicle
+    capabilities = coordinator.capabilities
+    departure_timers: list[DepartureTimer] = []
+    ac_timers: list[AirConditioningTimer] = []
+
+    if "departure_timers" in call.data:
+        if CapabilityId.DEPARTURE_TIMERS not in capabilities:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="departure_timers_not_supported",
+            )
+        departure_info = vehicle.departure_info
+        departure_timers = _updated_timers(
+            (departure_info.timers if departure_info else None) or [],
+            call.data["departure_timers"],
+            "recurring_on",
+        )
+
+    if "ac_timers" in call.data:
+        if CapabilityId.AIR_CONDITIONING_TIMERS not in capabilities:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="ac_timers_not_supported",
+            )
+        ac = vehicle.air_conditioning
+        ac_timers = _updated_timers(
+            ac.timers if ac else [], call.data["ac_timers"], "selected_days"
+        )
+
+    commands: dict[Hashable, Coroutine[Any, Any, None]] = {
+        ("departure_timer", timer.id): myskoda.set_departure_timer(vin, timer)
+        for timer in departure_timers
+    }
+    commands.update(
+        (("ac_timer", timer.id), myskoda.set_ac_timer(vin, timer))
+        for timer in ac_timers
+    )
+
+    if not commands:
+        _LOGGER.debug("Timers already up to date")
+        return
+
+    await _async_execute_all(coordinator, commands, "timers_update_failed")
+
+
+async def _async_handle_get_position_history(call: ServiceCall) -> ServiceResponse:
+    """Handle the get_position_history action.
+
+    Points are returned as [timestamp, latitude, longitude] lists, with the
+    timestamp in seconds since the epoch, which keeps long tracks small.
+    """
+    coordinator = _resolve_vehicle(call)
+    # Times without a time zone are in the time zone of Home Assistant.
+    start = dt_util.as_utc(start) if (start := call.data.get("start")) else None
+    end = dt_util.as_utc(end) if (end := call.data.get("end")) else None
+    points = coordinator.positions.track(coordinator.vin).query(start, end)
+    return {"points": [list(point) for point in points]}
+
+
 def async_setup_actions(hass: HomeAssistant) -> None:
     """Register the MySkoda actions.
 
     Called once from `async_setup`, which HA invokes exactly once per run
-    regardless of how many config entries exist, so the service is never
-    registered twice and needs no per-entry unload bookkeeping.
+    regardless of how many config entries exist, so the services are never
+    registered twice and need no per-entry unload bookkeeping.
     """
     hass.services.async_register(
         DOMAIN,
@@ -128,3 +490,28 @@ def async_setup_actions(hass: HomeAssistant) -> None:
         _async_handle_set_preferred_charging_time,
         schema=SERVICE_SET_PREFERRED_CHARGING_TIME_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PREFERRED_CHARGING_TIMES,
+        _async_handle_set_preferred_charging_times,
+        schema=SERVICE_SET_PREFERRED_CHARGING_TIMES_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_AIR_CONDITIONING_SETTINGS,
+        _async_handle_set_air_conditioning_settings,
+        schema=SERVICE_SET_AIR_CONDITIONING_SETTINGS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TIMERS,
+        _async_handle_set_timers,
+        schema=SERVICE_SET_TIMERS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_POSITION_HISTORY,
+        _async_handle_get_position_history,
+        schema=SERVICE_GET_POSITION_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,113 @@
+"""Resolve MySkoda device ids to the vehicles and charging profiles they represent."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util.hass_dict import HassKey
+
+from myskoda.models.chargingprofiles import ChargingProfile
+from myskoda.models.common import Vin
+
+from .const import DOMAIN
+from .coordinator import MySkodaDataUpdateCoordinator
+
+DATA_DEVICE_INDEX: HassKey["DeviceIndex"] = HassKey(f"{DOMAIN}_device_index")
+
+
+class DeviceIndex:
+    """Reverse index from device ids to vehicles and charging profiles.
+
+    Built lazily from the device registry and the loaded config entries, and
+    dropped whenever a device is created, updated or removed, or a config entry
+    is set up or unloaded. Resolving a device is then a dict lookup, no matter
+    how many accounts and vehicles exist.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new, empty device index."""
+        self.hass: HomeAssistant = hass
+        # device id -> (vin, charging profile id or None for the vehicle itself)
+        self._devices: dict[str, tuple[Vin, int | None]] | None = None
+        self._coordinators: dict[Vin, MySkodaDataUpdateCoordinator] = {}
+
+    @callback
+    def async_invalidate(self, *_: Any) -> None:
+        """Drop the index, it is rebuilt on the next lookup."""
+        self._devices = None
+
+    def _build(self) -> dict[str, tuple[Vin, int | None]]:
+        registry = dr.async_get(self.hass)
+        devices: dict[str, tuple[Vin, int | None]] = {}
+        coordinators: dict[Vin, MySkodaDataUpdateCoordinator] = {}
+
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.state is not ConfigEntryState.LOADED:
+                continue
+            coordinators.update(entry.runtime_data)
+            entry_devices = dr.async_entries_for_config_entry(registry, entry.entry_id)
+            vehicles: dict[str, Vin] = {}
+            for device in entry_devices:
+                for domain, identifier in device.identifiers:
+                    if domain == DOMAIN and identifier in entry.runtime_data:
+                        vehicles[device.id] = identifier
+                        devices[device.id] = (identifier, None)
+
+            # Charging profiles are children of the vehicle device, see
+            # MySkodaChargingProfileEntity.device_info.
+            for device in entry_devices:
+                if (vin := vehicles.get(device.via_device_id or "")) is None:
+                    continue
+                prefix = f"{vin}_charging_profile_"
+                for domain, identifier in device.identifiers:
+                    suffix = identifier.removeprefix(prefix)
+                    if domain == DOMAIN and suffix != identifier and suffix.isdigit():
+                        devices[device.id] = (vin, int(suffix))
+
+        self._coordinators = coordinators
+        return devices
+
+    def _lookup(
+        self, device_id: str
+    ) -> tuple[MySkodaDataUpdateCoordinator, int | None] | None:
+        if self._devices is None:
+            self._devices = self._build()
+        if (found := self._devices.get(device_id)) is None:
+            return None
+        vin, profile_id = found
+        coordinator = self._coordinators.get(vin)
+        if not coordinator or not coordinator.data:
+            return None
+        return coordinator, profile_id
+
+    def resolve_vehicle(self, device_id: str) -> MySkodaDataUpdateCoordinator | None:
+        """Resolve a vehicle device_id to its coordinator."""
+        if (found := self._lookup(device_id)) is None or found[1] is not None:
+            return None
+        return found[0]
+
+    def resolve_charging_profile(
+        self, device_id: str
+    ) -> tuple[MySkodaDataUpdateCoordinator, ChargingProfile] | None:
+        """Resolve a charging-profile device_id to its coordinator and ChargingProfile.
+
+        Only accepts devices created for a charging profile (children of a
+        vehicle device via `via_device`), not the vehicle device itself. A
+        profile that no longer exists in the vehicle data resolves to None.
+        """
+        if (found := self._lookup(device_id)) is None:
+            return None
+        coordinator, profile_id = found
+        if profile_id is None:
+            return None
+        profile = coordinator.charging_profile_index.profiles.get(profile_id)
+        return (coordinator, profile) if profile else None
+
+
+@callback
+def async_setup_device_index(hass: HomeAssistant) -> DeviceIndex:
+    """Create the device index and keep it in sync with the device registry."""
+    index = hass.data[DATA_DEVICE_INDEX] = DeviceIndex(hass)
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, index.async_invalidate)
+    return index
@@ -14,19 +14,14 @@ from homeassistant.helpers.typing import (
 )
 
 from myskoda.models.charging import Charging, ChargingStatus
+from myskoda.models.common import Coordinates
 from myskoda.models.info import CapabilityId, ViewPoint, ViewType
-from myskoda.models.position import (
-    Error,
-    ErrorType,
-    ParkingCoordinates,
-    ParkingPositionV3,
-    Position,
-    Positions,
-    PositionType,
-)
+from myskoda.models.position import ParkingCoordinates, ParkingPositionV3
 
 from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
 from .entity import MySkodaEntity
+from .position_history import vehicle_position
+from .snapshot import VehicleSection
 from .utils import add_supported_entities
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +44,16 @@ async def async_setup_entry(
 class DeviceTracker(MySkodaEntity, TrackerEntity):
     """GPS device tracker for MySkoda."""
 
+    sections = frozenset(
+        {
+            VehicleSection.POSITIONS,
+            VehicleSection.PARKING_POSITION,
+            VehicleSection.CHARGING,
+            VehicleSection.INFO,
+        }
+    )
+    required_capabilities = frozenset({CapabilityId.PARKING_POSITION})
+
     def __init__(self, coordinator: MySkodaDataUpdateCoordinator, vin: str) -> None:  # noqa: D107
         title = coordinator.data.vehicle.info.specification.title
         self.entity_description = TrackerEntityDescription(
@@ -58,23 +63,6 @@ class DeviceTracker(MySkodaEntity, TrackerEntity):
         )
         super().__init__(coordinator, vin)
 
-    def _positions(self) -> Positions | None:
-        return self.vehicle.positions
-
-    def _vehicle_position(self) -> Position | None:
-        if pos := self._positions():
-            if pos.positions:
-                return next(
-                    pos for pos in pos.positions if pos.type == PositionType.VEHICLE
-                )
-
-    def _pos_error(self) -> Error | None:
-        if pos := self._positions():
-            if pos.errors:
-                return next(
-                    err for err in pos.errors if err.type == ErrorType.VEHICLE_IN_MOTION
-                )
-
     def _charging(self) -> Charging | None:
         if charging := self.vehicle.charging:
             return charging
@@ -91,14 +79,9 @@ class DeviceTracker(MySkodaEntity, TrackerEntity):
         if pp := self._vehicle_parking_position():
             return pp.parking_position
 
-    def _gps_coordinates(self):
-        if self._pos_error():
-            return None
-        if position := self._vehicle_position():
-            return position.gps_coordinates
-        if pp := self._parking_position():
-            return pp.gps_coordinates
-        return None
+    def _gps_coordinates(self) -> Coordinates | None:
+        if position := vehicle_position(self.vehicle):
+            return position[1]
 
     @property
     def source_type(self) -> SourceType:  # noqa: D102
@@ -137,6 +120,3 @@ class DeviceTracker(MySkodaEntity, TrackerEntity):
             )
             attributes["entity_picture"] = renders.get(ViewPoint.EXTERIOR_SIDE)
         return attributes
-
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.PARKING_POSITION]
@@ -2,6 +2,7 @@
 
 import logging
 import json
+from dataclasses import asdict
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 from myskoda.models.fixtures import Endpoint
@@ -51,6 +52,8 @@ async def async_get_device_diagnostics(
 
         return {
             "fixtures": json.loads(result.to_json()),
+            "event_stats": asdict(coordinator.event_coalescer.stats),
+            "command_stats": asdict(coordinator.commands.stats),
         }
 
     except Exception as e:
@@ -90,7 +93,13 @@ async def async_get_config_entry_diagnostics(
             )
 
             # Append the successful data
-            results.append({"fixtures": json.loads(result.to_json())})
+            results.append(
+                {
+                    "fixtures": json.loads(result.to_json()),
+                    "event_stats": asdict(coordinator.event_coalescer.stats),
+                    "command_stats": asdict(coordinator.commands.stats),
+                }
+            )
 
         except Exception as e:
             error_message = f"Error generating diagnostics for VIN {vin}: {e}"
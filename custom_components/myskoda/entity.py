@@ -1,22 +1,26 @@
 """MySkoda Entity base classes."""
 
+from collections.abc import Coroutine, Sequence
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from myskoda import Vehicle
+from myskoda.models.air_conditioning import AirConditioningTimer
 from myskoda.models.chargingprofiles import (
     ChargingProfile,
     ChargingTimers,
     ChargingTimes,
 )
-from myskoda.models.event import OperationEvent
+from myskoda.models.departure import DepartureTimer
 from myskoda.models.info import CapabilityId, ViewPoint, ViewType
 
 from .const import DOMAIN
-from .coordinator import (
-    MySkodaDataUpdateCoordinator,
-    ServiceEvents,
-)
+from .coordinator import MySkodaDataUpdateCoordinator
+from .history import OperationHistory, ServiceEventHistory
+from .snapshot import Section, VehicleSection
 
 
 class MySkodaEntity(CoordinatorEntity):
@@ -25,6 +29,11 @@ class MySkodaEntity(CoordinatorEntity):
     vin: str
     coordinator: MySkodaDataUpdateCoordinator
     _attr_has_entity_name = True
+    # Sections of the coordinator state this entity reads. None means all of them.
+    sections: frozenset[Section] | None = None
+    # The vehicle must have all required and none of the forbidden capabilities.
+    required_capabilities: frozenset[CapabilityId] = frozenset()
+    forbidden_capabilities: frozenset[CapabilityId] = frozenset()
 
     def __init__(
         self,
@@ -40,12 +49,41 @@ class MySkodaEntity(CoordinatorEntity):
     def vehicle(self) -> Vehicle:
         return self.coordinator.data.vehicle
 
+    def _sections_changed(self) -> bool:
+        """Check if the update being pushed touches any section this entity reads."""
+        changed = self.coordinator.changed_sections
+        if changed is None or self.sections is None:
+            return True
+        return not changed.isdisjoint(self.sections)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when a section this entity reads has changed."""
+        if self._sections_changed():
+            super()._handle_coordinator_update()
+
+    async def async_send_command(
+        self, command: Coroutine[Any, Any, Any], setting: str = ""
+    ) -> Any:
+        """Send a command to the vehicle and return its result.
+
+        Commands are queued per vehicle. A queued command is replaced by a newer
+        one for the same setting of the same entity, see CommandExecutor.
+        """
+        return await self.coordinator.commands.async_execute(
+            (self.unique_id, setting), command
+        )
+
+    def is_command_pending(self, setting: str = "") -> bool:
+        """Check if a command for this setting is queued or being sent."""
+        return self.coordinator.commands.is_pending((self.unique_id, setting))
+
     @property
-    def operations(self) -> dict[str, OperationEvent]:
+    def operations(self) -> OperationHistory:
         return self.coordinator.data.operations
 
     @property
-    def service_events(self) -> ServiceEvents:
+    def service_events(self) -> ServiceEventHistory:
         return self.coordinator.data.service_events
 
     @property
@@ -60,29 +98,35 @@ class MySkodaEntity(CoordinatorEntity):
             "model": self.vehicle.info.specification.model,
         }
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return []
+    @property
+    def capabilities(self) -> frozenset[CapabilityId]:
+        return self.coordinator.capabilities
 
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return []
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:
+        """Check if a vehicle with the given capabilities supports this entity."""
+        return cls.required_capabilities <= capabilities
 
-    def is_supported(self) -> bool:
-        return all(
-            self.vehicle.has_capability(cap) for cap in self.required_capabilities()
-        )
+    @classmethod
+    def is_forbidden(cls, capabilities: frozenset[CapabilityId]) -> bool:
+        """Check if this entity must not be created for the given capabilities."""
+        return not cls.forbidden_capabilities.isdisjoint(capabilities)
 
-    def is_forbidden(self) -> bool:
-        return any(
-            self.vehicle.has_capability(cap) for cap in self.forbidden_capabilities()
-        )
+    @classmethod
+    def is_applicable(cls, capabilities: frozenset[CapabilityId]) -> bool:
+        """Check if this entity should be created for the given capabilities.
+
+        Evaluated on the class, so no entity is created for unsupported vehicles.
+        """
+        return not cls.is_forbidden(capabilities) and cls.is_supported(capabilities)
 
     def has_any_capability(self, cap: list[CapabilityId]) -> bool:
         """Check if any capabilities in the list is supported."""
-        return any(self.vehicle.has_capability(capability) for capability in cap)
+        return not self.capabilities.isdisjoint(cap)
 
     def has_all_capabilities(self, cap: list[CapabilityId]) -> bool:
         """Check if all capabilities in the list are supported."""
-        return all(self.vehicle.has_capability(capability) for capability in cap)
+        return self.capabilities.issuperset(cap)
 
     def get_renders(self) -> dict[ViewPoint, str]:
         """Return a dict of all vehicle image render URLs, keyed by view_point.
@@ -90,7 +134,7 @@ class MySkodaEntity(CoordinatorEntity):
         E.g.
         {"main": "https://ip-modcwp.azureedge.net/path/render.png"}
         """
-        return {render.view_point: render.url for render in self.vehicle.info.renders}
+        return self.coordinator.render_index.renders
 
     def get_composite_renders(self) -> dict[ViewType, dict[ViewPoint, str]]:
         """Return a dict of all vehicle composite render URLs, keyed by view_type.
@@ -99,12 +143,7 @@ class MySkodaEntity(CoordinatorEntity):
         E.g.
         {"home": {"exterior_side": "https://ip-modcwp.azureedge.net/path/render.png"}}
         """
-        composite_renders = {}
-        for cr in self.vehicle.info.composite_renders:
-            composite_renders[cr.view_type] = {
-                render.view_point: render.url for render in cr.layers
-            }
-        return composite_renders
+        return self.coordinator.render_index.composite_renders
 
 
 class MySkodaChargingProfileEntity(MySkodaEntity):
@@ -115,6 +154,8 @@ class MySkodaChargingProfileEntity(MySkodaEntity):
     """
 
     profile_id: int
+    sections = frozenset({VehicleSection.CHARGING_PROFILES})
+    required_capabilities = frozenset({CapabilityId.CHARGING_PROFILES})
 
     def __init__(
         self,
@@ -131,13 +172,7 @@ class MySkodaChargingProfileEntity(MySkodaEntity):
     @property
     def charging_profile(self) -> ChargingProfile | None:
         """Return the charging profile this entity represents, if it still exists."""
-        profiles = self.vehicle.charging_profiles
-        if not profiles:
-            return None
-        for profile in profiles.charging_profiles:
-            if profile.id == self.profile_id:
-                return profile
-        return None
+        return self.coordinator.charging_profile_index.profiles.get(self.profile_id)
 
     @property
     def available(self) -> bool:  # noqa: D102
@@ -152,9 +187,6 @@ class MySkodaChargingProfileEntity(MySkodaEntity):
             "via_device": (DOMAIN, self.vehicle.info.vin),
         }
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING_PROFILES]
-
 
 class MySkodaChargingTimeEntity(MySkodaChargingProfileEntity):
     """Base class for entities representing a single preferred charging time window.
@@ -182,13 +214,9 @@ class MySkodaChargingTimeEntity(MySkodaChargingProfileEntity):
     @property
     def charging_time(self) -> ChargingTimes | None:
         """Return the charging time window this entity represents, if it still exists."""
-        profile = self.charging_profile
-        if not profile:
-            return None
-        for times in profile.preferred_charging_times:
-            if times.id == self.entry_id:
-                return times
-        return None
+        return self.coordinator.charging_profile_index.charging_times.get(
+            (self.profile_id, self.entry_id)
+        )
 
     @property
     def available(self) -> bool:  # noqa: D102
@@ -221,14 +249,57 @@ class MySkodaChargingTimerEntity(MySkodaChargingProfileEntity):
     @property
     def charging_timer(self) -> ChargingTimers | None:
         """Return the charging timer this entity represents, if it still exists."""
-        profile = self.charging_profile
-        if not profile:
-            return None
-        for timer in profile.timers:
-            if timer.id == self.entry_id:
-                return timer
-        return None
+        return self.coordinator.charging_profile_index.timers.get(
+            (self.profile_id, self.entry_id)
+        )
 
     @property
     def available(self) -> bool:  # noqa: D102
         return super().available and self.charging_timer is not None
+
+
+type Timer = AirConditioningTimer | DepartureTimer
+
+
+class MySkodaTimerEntity[T: Timer](MySkodaEntity):
+    """Base class for entities representing a single timer of the vehicle.
+
+    The vehicle decides how many timers it has, so one entity is created per
+    timer found in the data, see `add_supported_timer_entities`.
+    """
+
+    timer_id: int
+
+    def __init__(
+        self,
+        coordinator,
+        vin: str,
+        timer_id: int,
+    ) -> None:  # noqa: D107
+        self.timer_id = timer_id
+        super().__init__(coordinator, vin)
+        self._attr_unique_id = f"{vin}_{self.entity_description.key}_{timer_id}"
+        self._attr_translation_placeholders = {"id": str(timer_id)}
+
+    @classmethod
+    def select_timers(cls, vehicle: Vehicle) -> Sequence[T]:
+        """Return the timers of the vehicle this kind of entity represents.
+
+        Subclasses override this, without it no entities are created.
+        """
+        return ()
+
+    def get_timer(self) -> T | None:
+        """Return the timer this entity represents, if it still exists."""
+        return next(
+            (
+                timer
+                for timer in self.select_timers(self.vehicle)
+                if timer.id == self.timer_id
+            ),
+            None,
+        )
+
+    @property
+    def available(self) -> bool:  # noqa: D102
+        return super().available and self.get_timer() is not None
@@ -0,0 +1,106 @@
+"""History of the MQTT events received for a vehicle."""
+
+from collections import OrderedDict, deque
+from typing import Any
+
+from myskoda.models.event import OperationEvent, ServiceEvent
+
+
+class OperationHistory:
+    """The most recent operations, keyed by request_id.
+
+    Status updates of a known operation replace it in place. The attributes of
+    the operation sensor are built once after each change and then reused.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Create a new operation history holding up to `capacity` operations."""
+        self.capacity: int = capacity
+        self._operations: OrderedDict[str, OperationEvent] = OrderedDict()
+        self._attributes: dict[str, Any] | None = None
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, event: OperationEvent) -> None:
+        """Add an operation, or update the status of a known one."""
+        self._operations[event.request_id] = event
+        while len(self._operations) > self.capacity:
+            self._operations.popitem(last=False)
+        self._attributes = None
+
+    @property
+    def latest(self) -> OperationEvent | None:
+        """Return the most recently started operation."""
+        if not self._operations:
+            return None
+        return next(reversed(self._operations.values()))
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the latest operation and the history of the previous ones.
+
+        - request_id, operation name, error_code and timestamp of the latest operation.
+        - history: a list of dicts with the same fields for the previous operations.
+        """
+        if self._attributes is None:
+            serialized = [
+                {
+                    "request_id": event.request_id,
+                    "operation": event.operation,
+                    "status": event.status.lower(),
+                    "error_code": event.error_code,
+                    "timestamp": event.timestamp,
+                }
+                for event in reversed(self._operations.values())
+            ]
+            self._attributes = (
+                {**serialized[0], "history": serialized[1:]} if serialized else {}
+            )
+        return self._attributes
+
+
+class ServiceEventHistory:
+    """The most recent service events, newest first.
+
+    Every event is converted to its attributes once, when it is received.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Create a new service event history holding up to `capacity` events."""
+        self.capacity: int = capacity
+        self._events: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._latest: ServiceEvent | None = None
+        self._attributes: dict[str, Any] | None = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event: ServiceEvent) -> None:
+        """Add a service event."""
+        self._events.appendleft(
+            {
+                "name": event.name.value,
+                "timestamp": event.timestamp,
+                "data": event.data.to_dict(),
+            }
+        )
+        self._latest = event
+        self._attributes = None
+
+    @property
+    def latest(self) -> ServiceEvent | None:
+        """Return the most recently received service event."""
+        return self._latest
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the latest service event and the history of the previous ones.
+
+        - name, timestamp and data of the latest service event.
+        - history: a list of dicts with the same fields for the previous events.
+        """
+        if self._attributes is None:
+            events = list(self._events)
+            self._attributes = {**events[0], "history": events[1:]} if events else {}
+        return self._attributes
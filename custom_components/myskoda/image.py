@@ -1,11 +1,11 @@
 """Images for the MySkoda integration."""
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 
-import httpx
 from homeassistant.components.image import (
-    GET_IMAGE_TIMEOUT,
+    Image,
     ImageEntity,
     ImageEntityDescription,
 )
@@ -17,12 +17,16 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import (
     DiscoveryInfoType,  # pyright: ignore [reportAttributeAccessIssue]
 )
+from homeassistant.util import dt as dt_util
 
 from myskoda.models.info import ViewPoint, ViewType
 
 from .const import CACHE_CLOCK_SKEW_TOLERANCE_IN_HOURS
 from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
 from .entity import MySkodaEntity
+from .image_cache import DATA_IMAGE_CACHE, ImageVariant, async_get_image_cache
+from .snapshot import VehicleSection
+from .utils import add_entities_for_new_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,16 +38,52 @@ async def async_setup_entry(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the image platform."""
+    await async_get_image_cache(hass)
 
     entities = []
     for vin, coordinator in config.runtime_data.items():
         for SensorClass in [
             MainRenderImage,
+            MainRenderThumbnailImage,
+            MainRenderMediumImage,
             LightStatusImage,
+            LightStatusThumbnailImage,
+            LightStatusMediumImage,
         ]:
             entities.append(SensorClass(coordinator, vin, hass))
 
     async_add_entities(entities)
+    add_composite_render_images(hass, config, async_add_entities)
+
+
+def add_composite_render_images(
+    hass: HomeAssistant,
+    entry: MySkodaConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Register one image per composite render layer of the vehicle.
+
+    Which renders exist differs between vehicles and changes with the vehicle
+    info, so images are added for each (view_type, view_point) pair found.
+    """
+
+    def _views(
+        coordinator: MySkodaDataUpdateCoordinator,
+    ) -> Iterable[tuple[ViewType, ViewPoint]]:
+        if not coordinator.data:
+            return
+        for view_type, layers in coordinator.render_index.composite_renders.items():
+            for view_point in layers:
+                yield view_type, view_point
+
+    add_entities_for_new_keys(
+        entry,
+        async_add_entities,
+        _views,
+        lambda coordinator, vin, view: CompositeRenderImage(
+            coordinator, vin, hass, *view
+        ),
+    )
 
 
 class MySkodaImage(MySkodaEntity, ImageEntity):
@@ -52,6 +92,10 @@ class MySkodaImage(MySkodaEntity, ImageEntity):
     vin: str
     coordinator: MySkodaDataUpdateCoordinator
     hass: HomeAssistant
+    # Serve a scaled down WebP version instead of the original image
+    variant: ImageVariant | None = None
+    # Check with the server whether the image changed, on every fetch
+    revalidate: bool = True
 
     def __init__(
         self,
@@ -63,39 +107,36 @@ class MySkodaImage(MySkodaEntity, ImageEntity):
         ImageEntity.__init__(self, hass)
         super().__init__(coordinator, vin)
 
+    async def _async_request_headers(self) -> dict[str, str]:
+        """Return the headers to fetch the image with."""
+        return {}
+
+    async def _async_load_image_from_url(self, url: str) -> Image | None:
+        """Load an image through the image cache shared by all entities."""
+        return await self.hass.data[DATA_IMAGE_CACHE].async_fetch(
+            url,
+            await self._async_request_headers(),
+            self.entity_id,
+            self.variant,
+            self.revalidate,
+        )
+
 
 class StatusImage(MySkodaImage):
     """A render of the current status of the vehicle."""
 
-    async def _fetch_url(self, url: str) -> httpx.Response | None:
-        """Fetch a URL passing in the MySkoda access token."""
-
-        try:
-            response = await self._client.get(
-                url,
-                timeout=GET_IMAGE_TIMEOUT,
-                follow_redirects=True,
-                headers={
-                    "authorization": f"Bearer {await self.coordinator.myskoda.authorization.get_access_token()}"
-                },
-            )
-            response.raise_for_status()
-        except httpx.TimeoutException:
-            _LOGGER.error("%s: Timeout getting image from %s", self.entity_id, url)
-            return None
-        except (httpx.RequestError, httpx.HTTPStatusError) as err:
-            _LOGGER.error(
-                "%s: Error getting new image from %s: %s",
-                self.entity_id,
-                url,
-                err,
-            )
-            return None
-        return response
+    sections = frozenset({VehicleSection.STATUS})
+
+    async def _async_request_headers(self) -> dict[str, str]:
+        """Pass in the MySkoda access token."""
+        token = await self.coordinator.myskoda.authorization.get_access_token()
+        return {"authorization": f"Bearer {token}"}
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self._sections_changed():
+            return
         if status := self.vehicle.status:
             if ts := status.car_captured_timestamp:
                 threshold = datetime.now(UTC) + timedelta(
@@ -117,6 +158,8 @@ class StatusImage(MySkodaImage):
 class MainRenderImage(MySkodaImage):
     """Main render of the vehicle."""
 
+    sections = frozenset({VehicleSection.INFO})
+
     entity_description = ImageEntityDescription(
         key="render_vehicle_main",
         translation_key="render_vehicle_main",
@@ -145,17 +188,44 @@ class MainRenderImage(MySkodaImage):
         """Return extra state attributes."""
         attributes = {}
         if render := self.get_renders():
-            attributes["vehicle_renders"] = {}
-            for r in render:
-                attributes["vehicle_renders"][r] = render[r]
+            attributes["vehicle_renders"] = render
 
         if composite_renders := self.get_composite_renders():
-            attributes["composite_renders"] = {}
-            for r in composite_renders:
-                attributes["composite_renders"][r] = composite_renders[r]
+            attributes["composite_renders"] = composite_renders
         return attributes
 
 
+class MainRenderThumbnailImage(MainRenderImage):
+    """Thumbnail of the main render of the vehicle."""
+
+    variant = ImageVariant.THUMBNAIL
+
+    entity_description = ImageEntityDescription(
+        key="render_vehicle_main_thumbnail",
+        translation_key="render_vehicle_main_thumbnail",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """The render URLs are already attributes of the main render."""
+        return {}
+
+
+class MainRenderMediumImage(MainRenderThumbnailImage):
+    """Medium size version of the main render of the vehicle."""
+
+    variant = ImageVariant.MEDIUM
+
+    entity_description = ImageEntityDescription(
+        key="render_vehicle_main_medium",
+        translation_key="render_vehicle_main_medium",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+
 class LightStatusImage(StatusImage):
     """Light 3x render of the vehicle status."""
 
@@ -169,3 +239,95 @@ class LightStatusImage(StatusImage):
     def image_url(self) -> str | None:
         if status := self.vehicle.status:
             return status.renders.light_mode.three_x
+
+
+class LightStatusThumbnailImage(LightStatusImage):
+    """Thumbnail of the light 3x render of the vehicle status."""
+
+    variant = ImageVariant.THUMBNAIL
+
+    entity_description = ImageEntityDescription(
+        key="render_light_3x_thumbnail",
+        translation_key="render_light_3x_thumbnail",
+        entity_registry_enabled_default=False,
+    )
+
+
+class LightStatusMediumImage(LightStatusImage):
+    """Medium size version of the light 3x render of the vehicle status."""
+
+    variant = ImageVariant.MEDIUM
+
+    entity_description = ImageEntityDescription(
+        key="render_light_3x_medium",
+        translation_key="render_light_3x_medium",
+        entity_registry_enabled_default=False,
+    )
+
+
+class CompositeRenderImage(MySkodaImage):
+    """One layer of a composite render of the vehicle.
+
+    A vehicle can have dozens of these, so the image isn't kept by the entity.
+    Every request is served by the image cache, which keeps a single copy of
+    identical images in memory and on disk. Render URLs change whenever the
+    render does, so cached copies are not revalidated.
+    """
+
+    sections = frozenset({VehicleSection.INFO})
+    revalidate = False
+
+    entity_description = ImageEntityDescription(
+        key="render_composite",
+        translation_key="render_composite",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+    def __init__(
+        self,
+        coordinator: MySkodaDataUpdateCoordinator,
+        vin: str,
+        hass: HomeAssistant,
+        view_type: ViewType,
+        view_point: ViewPoint,
+    ) -> None:
+        """Initialize the image for one (view_type, view_point) pair."""
+        self.view_type = view_type
+        self.view_point = view_point
+        super().__init__(coordinator, vin, hass)
+        self._attr_unique_id = (
+            f"{vin}_{self.entity_description.key}_"
+            f"{view_type.lower()}_{view_point.lower()}"
+        )
+        self._attr_translation_placeholders = {
+            "view_type": view_type.replace("_", " ").capitalize(),
+            "view_point": view_point.replace("_", " ").lower(),
+        }
+        self._url = self.image_url
+        self._attr_image_last_updated = dt_util.utcnow()
+
+    @property
+    def image_url(self) -> str | None:
+        return self.get_composite_renders().get(self.view_type, {}).get(self.view_point)
+
+    @property
+    def available(self) -> bool:  # noqa: D102
+        return super().available and self.image_url is not None
+
+    async def async_image(self) -> bytes | None:
+        """Return the image from the image cache, without keeping a copy."""
+        if not (url := self.image_url):
+            return None
+        if (image := await self._async_load_image_from_url(url)) is None:
+            return None
+        self._attr_content_type = image.content_type
+        return image.content
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._sections_changed() and (url := self.image_url) != self._url:
+            self._url = url
+            self._attr_image_last_updated = dt_util.utcnow()
+        super()._handle_coordinator_update()
@@ -0,0 +1,397 @@
+"""Cache of the vehicle images shared by all image entities."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable, Mapping
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import httpx
+from homeassistant.components.image import (
+    GET_IMAGE_TIMEOUT,
+    Image,
+    ImageContentTypeError,
+    valid_image_content_type,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util.hass_dict import HassKey
+from PIL import Image as PILImage
+
+from .const import (
+    DOMAIN,
+    IMAGE_CACHE_SIZE_IN_MB,
+    IMAGE_MEMORY_CACHE_SIZE_IN_MB,
+    STORE_SAVE_DELAY_IN_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+DATA_IMAGE_CACHE: HassKey["ImageCache"] = HassKey(f"{DOMAIN}_image_cache")
+
+
+class ImageVariant(StrEnum):
+    """Scaled down versions of an image, for dashboards showing many of them."""
+
+    THUMBNAIL = "thumbnail"
+    MEDIUM = "medium"
+
+
+# Longest side of each variant in pixels
+VARIANT_SIZES = {
+    ImageVariant.THUMBNAIL: 320,
+    ImageVariant.MEDIUM: 960,
+}
+VARIANT_CONTENT_TYPE = "image/webp"
+VARIANT_WEBP_QUALITY = 80
+
+
+def _render_variant(content: bytes, size: int) -> bytes:
+    """Scale an image down to fit within size x size and encode it as WebP.
+
+    Runs in the executor, decoding and encoding block for a while.
+    """
+    with PILImage.open(BytesIO(content)) as image:
+        if image.mode not in ("RGB", "RGBA"):
+            # Renders are transparent PNGs, keep the transparency.
+            image = image.convert("RGBA")
+        image.thumbnail((size, size))
+        output = BytesIO()
+        image.save(output, format="WEBP", quality=VARIANT_WEBP_QUALITY)
+        return output.getvalue()
+
+
+@dataclass
+class _CachedUrl:
+    """What is known about the image last fetched from a URL."""
+
+    digest: str
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ImageCache:
+    """Fetch images through a shared client and keep them on disk.
+
+    All image entities use the HTTP client of Home Assistant, so they share one
+    connection pool. Image files are stored by the SHA-256 of their content, so
+    identical renders of several vehicles are stored once. For each URL the
+    validators of the last response are kept, and the next fetch is a
+    conditional request which the server answers with 304 Not Modified when
+    the image is unchanged, after which it is read back from disk. This also
+    holds across restarts.
+
+    The least recently used files are evicted once the files exceed
+    IMAGE_CACHE_SIZE_IN_MB. The most recently used files are also kept in
+    memory, up to IMAGE_MEMORY_CACHE_SIZE_IN_MB. Entities asking for the same
+    image get the same bytes, so they don't need a copy of their own.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size: int, max_memory: int) -> None:
+        """Create a new image cache."""
+        self.hass: HomeAssistant = hass
+        self.max_size: int = max_size
+        self.max_memory: int = max_memory
+        self._client: httpx.AsyncClient = get_async_client(hass)
+        self._directory: Path = Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}_images"))
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_images", private=True
+        )
+        self._urls: dict[str, _CachedUrl] = {}
+        # file name -> size, least recently used first. Originals are named by
+        # the digest of their content, variants by the digest of the original.
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._size: int = 0
+        # file name -> content, least recently used first
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size: int = 0
+        self._in_flight: dict[Hashable, asyncio.Task[Image | None]] = {}
+
+    async def async_load(self) -> None:
+        """Load the index of the cached images from disk.
+
+        Entries whose file has gone missing are dropped.
+        """
+        data = await self._store.async_load() or {}
+        files: dict[str, int] = data.get("files", {})
+        existing = await self.hass.async_add_executor_job(
+            self._existing_files, list(files)
+        )
+        for digest, size in files.items():
+            if digest in existing:
+                self._files[digest] = size
+                self._size += size
+        for url, cached in data.get("urls", {}).items():
+            if cached.get("digest") in self._files:
+                self._urls[url] = _CachedUrl(**cached)
+
+    async def async_fetch(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        entity_id: str | None = None,
+        variant: ImageVariant | None = None,
+        revalidate: bool = True,
+    ) -> Image | None:
+        """Fetch an image, revalidating the cached copy if there is one.
+
+        When the server can't be reached, the cached copy is returned instead.
+        With a variant, the image is scaled down and re-encoded as WebP. Without
+        revalidate, a cached copy is returned as is, for URLs that point to
+        content which never changes.
+
+        Concurrent requests for the same image share one fetch.
+        """
+        return await self._async_single_flight(
+            (url, variant),
+            lambda: self._async_fetch_variant(
+                url, headers, entity_id, variant, revalidate
+            ),
+        )
+
+    async def _async_single_flight(
+        self, key: Hashable, fetch: Callable[[], Coroutine[Any, Any, Image | None]]
+    ) -> Image | None:
+        """Run fetch, unless a fetch for the same key is already running.
+
+        The fetch runs as a task of its own, so one caller giving up doesn't
+        cancel it for the others.
+        """
+        if (task := self._in_flight.get(key)) is None:
+            task = self.hass.async_create_task(fetch(), f"{DOMAIN} image fetch")
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch_variant(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None,
+        entity_id: str | None,
+        variant: ImageVariant | None,
+        revalidate: bool,
+    ) -> Image | None:
+        if variant is None:
+            return await self._async_fetch_original(url, headers, entity_id, revalidate)
+        # Variants of the same image share the fetch of the original.
+        image = await self._async_single_flight(
+            (url, None),
+            lambda: self._async_fetch_original(url, headers, entity_id, revalidate),
+        )
+        if image is None or (cached := self._urls.get(url)) is None:
+            return image
+        return await self._async_variant(cached.digest, image, variant, entity_id)
+
+    async def _async_fetch_original(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None,
+        entity_id: str | None,
+        revalidate: bool = True,
+    ) -> Image | None:
+        if not revalidate and (image := await self._async_read_cached(url)):
+            return image
+
+        cached = self._urls.get(url)
+        request_headers = dict(headers or {})
+        if cached and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = await self._client.get(
+                url,
+                timeout=GET_IMAGE_TIMEOUT,
+                follow_redirects=True,
+                headers=request_headers,
+            )
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
+        except httpx.TimeoutException:
+            _LOGGER.error("%s: Timeout getting image from %s", entity_id, url)
+            return await self._async_read_cached(url)
+        except (httpx.RequestError, httpx.HTTPStatusError) as err:
+            _LOGGER.error(
+                "%s: Error getting new image from %s: %s", entity_id, url, err
+            )
+            return await self._async_read_cached(url)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            if image := await self._async_read_cached(url):
+                return image
+            if cached is None:
+                _LOGGER.error("%s: Unexpected Not Modified from %s", entity_id, url)
+                return None
+            # The file is gone, fetch it again without validators.
+            return await self._async_fetch_original(url, headers, entity_id)
+
+        content_type = response.headers.get("content-type")
+        try:
+            content_type = valid_image_content_type(content_type)
+        except ImageContentTypeError:
+            _LOGGER.error(
+                "%s: Image from %s has invalid content type: %s",
+                entity_id,
+                url,
+                content_type,
+            )
+            return None
+
+        content = response.content
+        digest = sha256(content).hexdigest()
+        if digest not in self._files:
+            await self._async_add_file(digest, content)
+        self._files.move_to_end(digest)
+        self._urls[url] = _CachedUrl(
+            digest=digest,
+            content_type=content_type,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        await self._async_evict()
+        self._async_schedule_save()
+        return Image(content_type=content_type, content=content)
+
+    async def _async_variant(
+        self,
+        digest: str,
+        image: Image,
+        variant: ImageVariant,
+        entity_id: str | None,
+    ) -> Image:
+        """Return a variant of an image, creating it if it isn't cached.
+
+        Variants are named after the content of the original image, so they
+        are shared just like the originals. When the image can't be converted,
+        the original is returned.
+        """
+        name = f"{digest}.{variant}.webp"
+        if name in self._files:
+            content = await self._async_read(name)
+            if content is not None:
+                self._files.move_to_end(name)
+                return Image(content_type=VARIANT_CONTENT_TYPE, content=content)
+            self._forget(name)
+
+        try:
+            content = await self.hass.async_add_executor_job(
+                _render_variant, image.content, VARIANT_SIZES[variant]
+            )
+        except (OSError, ValueError) as err:
+            _LOGGER.error(
+                "%s: Failed to create %s variant of image: %s", entity_id, variant, err
+            )
+            return image
+        await self._async_add_file(name, content)
+        await self._async_evict()
+        self._async_schedule_save()
+        return Image(content_type=VARIANT_CONTENT_TYPE, content=content)
+
+    async def _async_add_file(self, name: str, content: bytes) -> None:
+        await self.hass.async_add_executor_job(self._write, name, content)
+        self._files[name] = len(content)
+        self._size += len(content)
+        self._remember(name, content)
+
+    async def _async_read(self, name: str) -> bytes | None:
+        """Read a file, from memory if it is kept there."""
+        if (content := self._memory.get(name)) is not None:
+            self._memory.move_to_end(name)
+            return content
+        content = await self.hass.async_add_executor_job(self._read, name)
+        if content is not None:
+            self._remember(name, content)
+        return content
+
+    def _remember(self, name: str, content: bytes) -> None:
+        """Keep a file in memory, dropping the least recently used ones."""
+        if len(content) > self.max_memory:
+            return
+        self._memory_size -= len(self._memory.pop(name, b""))
+        self._memory[name] = content
+        self._memory_size += len(content)
+        while self._memory_size > self.max_memory:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_size -= len(dropped)
+
+    async def _async_read_cached(self, url: str) -> Image | None:
+        """Read the cached image of a URL from disk, dropping it if it is gone."""
+        if (cached := self._urls.get(url)) is None:
+            return None
+        content = await self._async_read(cached.digest)
+        if content is None:
+            self._forget(cached.digest)
+            self._async_schedule_save()
+            return None
+        self._files.move_to_end(cached.digest)
+        return Image(content_type=cached.content_type, content=content)
+
+    async def _async_evict(self) -> None:
+        """Remove the least recently used files until the cache fits."""
+        evicted = []
+        while self._size > self.max_size and len(self._files) > 1:
+            digest = next(iter(self._files))
+            self._forget(digest)
+            evicted.append(digest)
+        if evicted:
+            _LOGGER.debug("Evicting %d images from the image cache", len(evicted))
+            await self.hass.async_add_executor_job(self._delete, evicted)
+
+    def _forget(self, name: str) -> None:
+        self._size -= self._files.pop(name, 0)
+        self._memory_size -= len(self._memory.pop(name, b""))
+        for url in [url for url, cached in self._urls.items() if cached.digest == name]:
+            del self._urls[url]
+
+    def _path(self, name: str) -> Path:
+        return self._directory / name
+
+    def _existing_files(self, names: list[str]) -> set[str]:
+        return {name for name in names if self._path(name).is_file()}
+
+    def _read(self, name: str) -> bytes | None:
+        try:
+            return self._path(name).read_bytes()
+        except OSError:
+            return None
+
+    def _write(self, name: str, content: bytes) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path(name).write_bytes(content)
+
+    def _delete(self, names: list[str]) -> None:
+        for name in names:
+            self._path(name).unlink(missing_ok=True)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_IN_SECONDS)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "files": dict(self._files),
+            "urls": {url: asdict(cached) for url, cached in self._urls.items()},
+        }
+
+
+async def async_get_image_cache(hass: HomeAssistant) -> ImageCache:
+    """Return the image cache, creating and loading it on first use."""
+    if (cache := hass.data.get(DATA_IMAGE_CACHE)) is None:
+        cache = ImageCache(
+            hass,
+            IMAGE_CACHE_SIZE_IN_MB * 1024 * 1024,
+            IMAGE_MEMORY_CACHE_SIZE_IN_MB * 1024 * 1024,
+        )
+        hass.data[DATA_IMAGE_CACHE] = cache
+        await cache.async_load()
+    return cache
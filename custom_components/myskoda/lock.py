@@ -1,7 +1,6 @@
 """Locks for the MySkoda integration."""
 
 import logging
-from datetime import timedelta
 from typing import Coroutine
 
 from homeassistant.components.lock import (
@@ -12,7 +11,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType  # pyright: ignore [reportAttributeAccessIssue]
-from homeassistant.util import Throttle
 
 from aiohttp import ClientResponseError
 
@@ -21,13 +19,13 @@ from myskoda.models.info import CapabilityId
 from myskoda.mqtt import OperationFailedError
 
 from .const import (
-    API_COOLDOWN_IN_SECONDS,
     CONF_SPIN,
     DOMAIN,
     CONF_READONLY,
 )
 from .coordinator import MySkodaConfigEntry
 from .entity import MySkodaEntity
+from .snapshot import VehicleSection
 from .utils import add_supported_entities
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,14 +56,6 @@ class MySkodaLock(MySkodaEntity, LockEntity):
         if not self.coordinator.entry.options.get(CONF_SPIN):
             self._is_enabled = False
 
-    def _disable_lock(self):
-        self._is_enabled = False
-        self.async_write_ha_state()
-
-    def _enable_lock(self):
-        self._is_enabled = True
-        self.async_write_ha_state()
-
     def _ensure_not_readonly(self):
         if self.coordinator.entry.options.get(CONF_READONLY):
             raise ServiceValidationError(
@@ -75,14 +65,7 @@ class MySkodaLock(MySkodaEntity, LockEntity):
 
     async def _operate_lock(self, to_call: Coroutine):
         """Operate lock by executing to_call."""
-        if not self._is_enabled:
-            return
-
-        self._disable_lock()
-        try:
-            await to_call
-        finally:
-            self._enable_lock()
+        await self.async_send_command(to_call)
 
     @property
     def available(self) -> bool:
@@ -92,6 +75,9 @@ class MySkodaLock(MySkodaEntity, LockEntity):
 class DoorLock(MySkodaLock):
     """Central door lock."""
 
+    sections = frozenset({VehicleSection.STATUS})
+    required_capabilities = frozenset({CapabilityId.ACCESS})
+
     entity_description = LockEntityDescription(
         key="door_lock",
         translation_key="door_lock",
@@ -110,12 +96,8 @@ class DoorLock(MySkodaLock):
                 ):
                     return False
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_lock_unlock(self, lock: bool, spin: str, **kwargs):  # noqa: D102
-        """Internal method to have a central location for the Throttle."""
-        if not self._is_enabled:
-            return
-
+        """Internal method to have a central location for locking and unlocking."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         try:
             if lock:
@@ -128,8 +110,8 @@ class DoorLock(MySkodaLock):
     async def async_lock(self, **kwargs) -> None:
         entry_options = self.coordinator.entry.options
         self._ensure_not_readonly()
-        if entry_options.get(CONF_SPIN):
-            await self._async_lock_unlock(lock=True, spin=entry_options.get(CONF_SPIN))
+        if spin := entry_options.get(CONF_SPIN):
+            await self._async_lock_unlock(lock=True, spin=spin)
             _LOGGER.info("Sent command to lock the vehicle.")
         else:
             _LOGGER.error("Cannot lock car: No S-PIN set.")
@@ -138,12 +120,9 @@ class DoorLock(MySkodaLock):
     async def async_unlock(self, **kwargs) -> None:
         entry_options = self.coordinator.entry.options
         self._ensure_not_readonly()
-        if entry_options.get(CONF_SPIN):
-            await self._async_lock_unlock(lock=False, spin=entry_options.get(CONF_SPIN))
+        if spin := entry_options.get(CONF_SPIN):
+            await self._async_lock_unlock(lock=False, spin=spin)
             _LOGGER.info("Sent command to unlock the vehicle.")
         else:
             _LOGGER.error("Cannot unlock car: No S-PIN set.")
             raise ServiceValidationError("no_spin")
-
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.ACCESS]
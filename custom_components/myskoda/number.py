@@ -1,7 +1,6 @@
 """Number entities for MySkoda."""
 
 import logging
-from datetime import timedelta
 from typing import Coroutine
 
 from homeassistant.components.number import (
@@ -15,7 +14,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import DiscoveryInfoType  # pyright: ignore [reportAttributeAccessIssue]
-from homeassistant.util import Throttle
 from homeassistant.exceptions import ServiceValidationError
 
 from aiohttp import ClientResponseError
@@ -23,9 +21,10 @@ from aiohttp import ClientResponseError
 from myskoda.models.info import CapabilityId
 from myskoda.mqtt import OperationFailedError
 
-from .const import API_COOLDOWN_IN_SECONDS, CONF_READONLY, DOMAIN
+from .const import CONF_READONLY, DOMAIN
 from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
 from .entity import MySkodaEntity
+from .snapshot import VehicleSection
 from .utils import add_supported_entities
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,12 +55,6 @@ class MySkodaNumber(MySkodaEntity, NumberEntity):
     def __init__(self, coordinator: MySkodaDataUpdateCoordinator, vin: str):
         super().__init__(coordinator, vin)
 
-    def is_supported(self) -> bool:
-        all_capabilities_present = all(
-            self.vehicle.has_capability(cap) for cap in self.required_capabilities()
-        )
-        return all_capabilities_present
-
     def _ensure_not_readonly(self):
         if self.coordinator.entry.options.get(CONF_READONLY):
             raise ServiceValidationError(
@@ -75,7 +68,7 @@ class MySkodaNumber(MySkodaEntity, NumberEntity):
         self._assumed_value = value
         self._attr_native_value = value
 
-        await to_call
+        await self.async_send_command(to_call)
 
     @property
     def assumed_state(self) -> bool:
@@ -85,6 +78,8 @@ class MySkodaNumber(MySkodaEntity, NumberEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle an update from the coordinator by unsetting the _assumed_value since it is now verified."""
+        if not self._sections_changed():
+            return
         self._assumed_value = None
         super()._handle_coordinator_update()
 
@@ -95,6 +90,8 @@ class ChargeLimit(MySkodaNumber):
     Represents the maximum value in percent that the car can be charged to.
     """
 
+    sections = frozenset({VehicleSection.CHARGING})
+
     entity_description = NumberEntityDescription(
         key="charge_limit",
         native_max_value=100,
@@ -113,7 +110,6 @@ class ChargeLimit(MySkodaNumber):
             if settings := charging.settings:
                 return settings.target_state_of_charge_in_percent
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def async_set_native_value(self, value: float):  # noqa: D102
         self._ensure_not_readonly()
 
@@ -126,19 +122,22 @@ class ChargeLimit(MySkodaNumber):
             _LOGGER.error("Failed to set charging limit: %s", exc)
         _LOGGER.info("Set charging limit to %s", int(value))
 
-    def is_supported(self) -> bool:
-        charge_limit_supported = self.vehicle.has_capability(
-            CapabilityId.EXTENDED_CHARGING_SETTINGS
-        ) or (
-            self.vehicle.has_capability(CapabilityId.CHARGING)
-            and not self.vehicle.has_capability(CapabilityId.CHARGING_MQB)
+    @classmethod
+    def is_supported(cls, capabilities: frozenset[CapabilityId]) -> bool:
+        return CapabilityId.EXTENDED_CHARGING_SETTINGS in capabilities or (
+            CapabilityId.CHARGING in capabilities
+            and CapabilityId.CHARGING_MQB not in capabilities
         )
-        return charge_limit_supported
 
 
 class AuxiliaryHeaterDuration(MySkodaNumber, RestoreEntity):
     """Auxiliary heater timer."""
 
+    required_capabilities = frozenset({CapabilityId.AUXILIARY_HEATING})
+    forbidden_capabilities = frozenset(
+        {CapabilityId.AUXILIARY_HEATING_TEMPERATURE_SETTING}
+    )
+
     entity_description = NumberEntityDescription(
         key="auxiliary_heater_duration",
         mode=NumberMode.SLIDER,
@@ -189,9 +188,3 @@ class AuxiliaryHeaterDuration(MySkodaNumber, RestoreEntity):
 
         # Update HA state to reflect the restored value
         self.async_write_ha_state()
-
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AUXILIARY_HEATING]
-
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AUXILIARY_HEATING_TEMPERATURE_SETTING]
@@ -0,0 +1,273 @@
+"""Compact history of the positions of the vehicles."""
+
+import base64
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from myskoda import Vehicle
+from myskoda.models.common import Coordinates, Vin
+from myskoda.models.position import ErrorType, PositionType
+
+from .const import (
+    DOMAIN,
+    POSITION_HISTORY_RETENTION_IN_DAYS,
+    STORE_SAVE_DELAY_IN_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Coordinates are kept in millionths of a degree, about 0.1 m.
+COORDINATE_SCALE = 1_000_000
+
+
+def vehicle_position(vehicle: Vehicle) -> tuple[datetime, Coordinates] | None:
+    """Return the current position of the vehicle and when it was captured.
+
+    The vehicle position is preferred over the parking position. While the
+    vehicle is in motion, its position is unknown.
+    """
+    if positions := vehicle.positions:
+        if any(err.type == ErrorType.VEHICLE_IN_MOTION for err in positions.errors):
+            return None
+        for position in positions.positions:
+            if position.type == PositionType.VEHICLE:
+                return (
+                    positions.car_captured_timestamp or positions.timestamp,
+                    position.gps_coordinates,
+                )
+    if parking := vehicle.parking_position:
+        return (
+            parking.car_captured_timestamp or parking.timestamp,
+            parking.parking_position.gps_coordinates,
+        )
+    return None
+
+
+def _encode(values: Iterable[int]) -> bytearray:
+    """Encode integers as zigzag variable-length integers, small ones take a byte."""
+    encoded = bytearray()
+    for value in values:
+        value = value * 2 if value >= 0 else -value * 2 - 1
+        while value >= 0x80:
+            encoded.append(value & 0x7F | 0x80)
+            value >>= 7
+        encoded.append(value)
+    return encoded
+
+
+def _decode(data: bytes) -> list[int]:
+    """Decode integers encoded by `_encode`, dropping a truncated one at the end."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value >> 1 if not value & 1 else -(value >> 1) - 1)
+        value = shift = 0
+    return values
+
+
+class PositionTrack:
+    """The positions of one vehicle, oldest first.
+
+    Points are only ever appended. In memory they are kept as arrays of
+    seconds since the epoch and coordinates in millionths of a degree, so a
+    time range is found by bisecting the timestamps. For storage, every point
+    is encoded as its difference to the previous point, which for a vehicle
+    moving around takes a few bytes per point instead of a state row.
+    """
+
+    def __init__(self) -> None:
+        """Create a new, empty track."""
+        self._timestamps: array[int] = array("q")
+        self._latitudes: array[int] = array("i")
+        self._longitudes: array[int] = array("i")
+        self._encoded: bytearray = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PositionTrack":
+        """Rebuild a track from the output of `to_bytes`."""
+        track = cls()
+        values = _decode(data)
+        timestamp = latitude = longitude = 0
+        for index in range(0, len(values) - len(values) % 3, 3):
+            timestamp += values[index]
+            latitude += values[index + 1]
+            longitude += values[index + 2]
+            track._append(timestamp, latitude, longitude)
+        return track
+
+    def to_bytes(self) -> bytes:
+        """Return the delta encoded points."""
+        return bytes(self._encoded)
+
+    def append(self, timestamp: datetime, coordinates: Coordinates) -> bool:
+        """Add a point, return whether it was added.
+
+        Points older than the last one are ignored, as are points at the same
+        position as the last one: a parked vehicle takes a single point.
+        """
+        seconds = int(timestamp.timestamp())
+        latitude = round(coordinates.latitude * COORDINATE_SCALE)
+        longitude = round(coordinates.longitude * COORDINATE_SCALE)
+        if self._timestamps:
+            if seconds <= self._timestamps[-1]:
+                return False
+            if (latitude, longitude) == (self._latitudes[-1], self._longitudes[-1]):
+                return False
+        self._append(seconds, latitude, longitude)
+        return True
+
+    def _append(self, seconds: int, latitude: int, longitude: int) -> None:
+        self._timestamps.append(seconds)
+        self._latitudes.append(latitude)
+        self._longitudes.append(longitude)
+        self._encoded += _encode(self._deltas(len(self._timestamps) - 1))
+
+    def _deltas(self, index: int) -> tuple[int, int, int]:
+        """Return the difference between a point and the one before it."""
+        if not index:
+            return (self._timestamps[0], self._latitudes[0], self._longitudes[0])
+        return (
+            self._timestamps[index] - self._timestamps[index - 1],
+            self._latitudes[index] - self._latitudes[index - 1],
+            self._longitudes[index] - self._longitudes[index - 1],
+        )
+
+    @property
+    def oldest(self) -> datetime | None:
+        """Return when the oldest point was captured."""
+        if not self._timestamps:
+            return None
+        return dt_util.utc_from_timestamp(self._timestamps[0])
+
+    def query(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[tuple[int, float, float]]:
+        """Return (seconds since the epoch, latitude, longitude) of the points in a range.
+
+        Both ends of the range are inclusive and optional.
+        """
+        first = 0 if start is None else bisect_left(self._timestamps, start.timestamp())
+        last = (
+            len(self._timestamps)
+            if end is None
+            else bisect_right(self._timestamps, end.timestamp())
+        )
+        return [
+            (timestamp, latitude / COORDINATE_SCALE, longitude / COORDINATE_SCALE)
+            for timestamp, latitude, longitude in zip(
+                self._timestamps[first:last],
+                self._latitudes[first:last],
+                self._longitudes[first:last],
+                strict=True,
+            )
+        ]
+
+    def prune(self, before: datetime) -> int:
+        """Drop the points captured before a point in time, return how many.
+
+        The differences are relative to the previous point, so the remaining
+        points are encoded again.
+        """
+        count = bisect_left(self._timestamps, before.timestamp())
+        if not count:
+            return 0
+        del self._timestamps[:count]
+        del self._latitudes[:count]
+        del self._longitudes[:count]
+        self._encoded = _encode(
+            delta for index in range(len(self)) for delta in self._deltas(index)
+        )
+        return count
+
+
+class PositionHistoryStore:
+    """Keeps the position history of all vehicles of a config entry on disk.
+
+    Points older than POSITION_HISTORY_RETENTION_IN_DAYS are dropped. Writes
+    to disk are delayed and combined.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Create a new store."""
+        self.hass: HomeAssistant = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}_positions.{entry_id}", private=True
+        )
+        self._tracks: dict[Vin, PositionTrack] = {}
+
+    async def async_load(self) -> None:
+        """Load the position history from disk."""
+        if data := await self._store.async_load():
+            self._tracks = await self.hass.async_add_executor_job(
+                self._decode_tracks, data.get("vehicles", {})
+            )
+
+    @staticmethod
+    def _decode_tracks(vehicles: dict[Vin, str]) -> dict[Vin, PositionTrack]:
+        """Decode the stored tracks, runs in the executor."""
+        return {
+            vin: PositionTrack.from_bytes(base64.b64decode(encoded))
+            for vin, encoded in vehicles.items()
+        }
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk right away."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the position history from disk."""
+        await self._store.async_remove()
+
+    def track(self, vin: Vin) -> PositionTrack:
+        """Return the position history of a vehicle."""
+        return self._tracks.get(vin) or PositionTrack()
+
+    @callback
+    def record(self, vin: Vin, vehicle: Vehicle) -> None:
+        """Add the current position of a vehicle to its history."""
+        if (position := vehicle_position(vehicle)) is None:
+            return
+        track = self._tracks.setdefault(vin, PositionTrack())
+        if not track.append(*position):
+            return
+        # Pruning encodes the whole track again, so only do it once a day.
+        cutoff = dt_util.utcnow() - timedelta(days=POSITION_HISTORY_RETENTION_IN_DAYS)
+        if (oldest := track.oldest) and oldest < cutoff - timedelta(days=1):
+            pruned = track.prune(cutoff)
+            _LOGGER.debug("Pruned %d positions from the history of %s", pruned, vin)
+        self._async_schedule_save()
+
+    def retain_vehicles(self, vins: list[Vin]) -> None:
+        """Drop the history of vehicles that are no longer part of the account."""
+        for vin in self._tracks.keys() - set(vins):
+            del self._tracks[vin]
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_IN_SECONDS)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "vehicles": {
+                vin: base64.b64encode(track.to_bytes()).decode()
+                for vin, track in self._tracks.items()
+            }
+        }
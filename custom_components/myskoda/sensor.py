@@ -39,6 +39,7 @@ from myskoda.models.info import CapabilityId
 from .const import OUTSIDE_TEMP_MAX_BOUND, OUTSIDE_TEMP_MIN_BOUND
 from .coordinator import MySkodaConfigEntry
 from .entity import MySkodaChargingProfileEntity, MySkodaEntity
+from .snapshot import EventSection, VehicleSection
 from .utils import add_supported_charging_profile_entities, add_supported_entities
 
 
@@ -78,6 +79,7 @@ async def async_setup_entry(
             TargetBatteryPercentage,
             ClimatisationTimeLeft,
             AuxHeaterTimeLeft,
+            PollInterval,
             OverallMileage,
             OverallTravelTime,
             OverallAverageSpeed,
@@ -117,6 +119,8 @@ class MySkodaSensor(MySkodaEntity, SensorEntity):
 class Operation(MySkodaSensor):
     """Report the most recent operation."""
 
+    sections = frozenset({EventSection.OPERATIONS})
+
     entity_description = SensorEntityDescription(
         key="operation",
         translation_key="operation",
@@ -129,42 +133,23 @@ class Operation(MySkodaSensor):
     @property
     def native_value(self) -> str | None:  # noqa: D102
         """Returns the status of the last seen operation."""
-        if self.operations:
-            last_operation = list(self.operations.values())[-1]
+        if last_operation := self.operations.latest:
             return last_operation.status.lower()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Returns additional attributes for the operation sensor.
 
-        - request_id, operation name, error_code and timestamp of the last seen operation.
-        - history: a list of dicts with the same fields for the previously seen operations.
+        See OperationHistory.attributes.
         """
-        attributes = {}
-        if not self.operations:
-            return attributes
-
-        operations = list(self.operations.values())
-        operations.reverse()
-        filtered = [
-            {
-                "request_id": event.request_id,
-                "operation": event.operation,
-                "status": event.status.lower(),
-                "error_code": event.error_code,
-                "timestamp": event.timestamp,
-            }
-            for event in operations
-        ]
-        attributes = filtered[0]
-        attributes["history"] = filtered[1:]
-
-        return attributes
+        return self.operations.attributes
 
 
 class ServiceEvent(MySkodaSensor):
     """Report the most recent service event."""
 
+    sections = frozenset({EventSection.SERVICE_EVENTS})
+
     entity_description = SensorEntityDescription(
         key="service_event",
         translation_key="service_event",
@@ -175,37 +160,24 @@ class ServiceEvent(MySkodaSensor):
     @property
     def native_value(self) -> datetime | None:
         """Returns the timestamp of the last seen service event."""
-        if self.service_events:
-            last_service_event = self.service_events[0]
+        if last_service_event := self.service_events.latest:
             return last_service_event.timestamp
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Returns additional attributes for the service event sensor.
 
-        - history: a list of dicts with the same fields for the previously seen event.
+        See ServiceEventHistory.attributes.
         """
-        attributes = {}
-        if not self.service_events:
-            return attributes
-
-        filtered = [
-            {
-                "name": event.name.value,
-                "timestamp": event.timestamp,
-                "data": event.data.to_dict(),
-            }
-            for event in self.service_events
-        ]
-        attributes = filtered[0]
-        attributes["history"] = filtered[1:]
-
-        return attributes
+        return self.service_events.attributes
 
 
 class CampingModeEndsAt(MySkodaSensor):
     """Report when camping mode will automatically end."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.CAMPING_MODE})
+
     entity_description = SensorEntityDescription(
         key="camping_mode_ends_at",
         translation_key="camping_mode_ends_at",
@@ -219,13 +191,13 @@ class CampingModeEndsAt(MySkodaSensor):
         if (ac := self.vehicle.air_conditioning) and ac.camping_mode is not None:
             return ac.camping_mode.ends_at
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CAMPING_MODE]
-
 
 class SoftwareVersion(MySkodaSensor):
     """Current software version of a vehicle."""
 
+    sections = frozenset({VehicleSection.INFO, VehicleSection.SOFTWARE_UPDATE_STATUS})
+    required_capabilities = frozenset({CapabilityId.CHARGING_MEB})
+
     entity_description = SensorEntityDescription(
         key="software_version",
         translation_key="software_version",
@@ -237,13 +209,10 @@ class SoftwareVersion(MySkodaSensor):
             return sus.current_software_version
         return self.vehicle.info.software_version
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING_MEB]
-
 
 class ChargingSensor(MySkodaSensor):
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING]
+    sections = frozenset({VehicleSection.CHARGING})
+    required_capabilities = frozenset({CapabilityId.CHARGING})
 
 
 class BatteryPercentage(ChargingSensor):
@@ -308,6 +277,10 @@ class BatteryPercentage(ChargingSensor):
 class ChargingPower(ChargingSensor):
     """How fast the car is charging in kW."""
 
+    required_capabilities = frozenset(
+        {CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS}
+    )
+
     entity_description = SensorEntityDescription(
         key="charging_power",
         state_class=SensorStateClass.MEASUREMENT,
@@ -321,13 +294,14 @@ class ChargingPower(ChargingSensor):
         if status := self._status():
             return status.charge_power_in_kw
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS]
-
 
 class AddBlueRange(MySkodaSensor):
     """The vehicles's AdBlue range - only for vehicles where its available."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset({CapabilityId.STATE, CapabilityId.FUEL_STATUS})
+    forbidden_capabilities = frozenset({CapabilityId.CHARGING})
+
     entity_description = SensorEntityDescription(
         key="adblue_range",
         state_class=SensorStateClass.MEASUREMENT,
@@ -349,16 +323,14 @@ class AddBlueRange(MySkodaSensor):
             return driving_range.ad_blue_range is not None
         return False
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS]
-
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING]
-
 
 class CombustionRange(MySkodaSensor):
     """The vehicle's combustion range - only for hybrid vehicles."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset({CapabilityId.STATE, CapabilityId.FUEL_STATUS})
+    forbidden_capabilities = frozenset({CapabilityId.CHARGING_MEB})
+
     entity_description = SensorEntityDescription(
         key="combustion_range",
         state_class=SensorStateClass.MEASUREMENT,
@@ -383,16 +355,15 @@ class CombustionRange(MySkodaSensor):
             return driving_range.car_type == EngineType.HYBRID
         return False
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS]
-
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING_MEB]
-
 
 class ElectricRange(MySkodaSensor):
     """The vehicle's electric range - only for hybrid vehicles."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset(
+        {CapabilityId.STATE, CapabilityId.FUEL_STATUS, CapabilityId.CHARGING_MQB}
+    )
+
     entity_description = SensorEntityDescription(
         key="electric_range",
         state_class=SensorStateClass.MEASUREMENT,
@@ -407,13 +378,14 @@ class ElectricRange(MySkodaSensor):
             if driving_range.secondary_engine_range is not None:
                 return driving_range.secondary_engine_range.remaining_range_in_km
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS, CapabilityId.CHARGING_MQB]
-
 
 class GasRange(MySkodaSensor):
     """The vehicle's gas range - only for hybrid CNG vehicles."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset({CapabilityId.STATE, CapabilityId.FUEL_STATUS})
+    forbidden_capabilities = frozenset({CapabilityId.CHARGING})
+
     entity_description = SensorEntityDescription(
         key="gas_range",
         state_class=SensorStateClass.MEASUREMENT,
@@ -438,16 +410,14 @@ class GasRange(MySkodaSensor):
             )
         return False
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS]
-
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING]
-
 
 class GasLevel(MySkodaSensor):
     """The vehicle's gas level - only for hybrid CNG vehicles."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset({CapabilityId.STATE, CapabilityId.FUEL_STATUS})
+    forbidden_capabilities = frozenset({CapabilityId.CHARGING})
+
     entity_description = SensorEntityDescription(
         key="gas_level",
         state_class=SensorStateClass.MEASUREMENT,
@@ -470,16 +440,13 @@ class GasLevel(MySkodaSensor):
             )
         return False
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS]
-
-    def forbidden_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING]
-
 
 class FuelLevel(MySkodaSensor):
     """The vehicle's combustion engine fuel level - only for non electric vehicles."""
 
+    sections = frozenset({VehicleSection.DRIVING_RANGE})
+    required_capabilities = frozenset({CapabilityId.STATE, CapabilityId.FUEL_STATUS})
+
     entity_description = SensorEntityDescription(
         key="fuel_level",
         state_class=SensorStateClass.MEASUREMENT,
@@ -497,13 +464,14 @@ class FuelLevel(MySkodaSensor):
                 if secondary.engine_type in [EngineType.GASOLINE, EngineType.DIESEL]:
                     return secondary.current_fuel_level_in_percent
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE, CapabilityId.FUEL_STATUS]
-
 
 class Range(MySkodaSensor):
     """Estimated range of vehicle in km."""
 
+    # Falls back to the cruising range of the battery in the charging status.
+    sections = frozenset({VehicleSection.DRIVING_RANGE, VehicleSection.CHARGING})
+    required_capabilities = frozenset({CapabilityId.STATE})
+
     entity_description = SensorEntityDescription(
         key="range",
         state_class=SensorStateClass.MEASUREMENT,
@@ -546,13 +514,14 @@ class Range(MySkodaSensor):
             if status.battery.remaining_cruising_range_in_meters is not None:
                 return status.battery.remaining_cruising_range_in_meters / 1000
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE]
-
 
 class TargetBatteryPercentage(ChargingSensor):
     """Charging target of the EV's battery in percent."""
 
+    required_capabilities = frozenset(
+        {CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS}
+    )
+
     entity_description = SensorEntityDescription(
         key="target_battery_percentage",
         state_class=SensorStateClass.MEASUREMENT,
@@ -565,13 +534,12 @@ class TargetBatteryPercentage(ChargingSensor):
         if charging := self._charging():
             return charging.settings.target_state_of_charge_in_percent
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS]
-
 
 class Mileage(MySkodaSensor):
     """The vehicle's mileage (total kilometers driven)."""
 
+    sections = frozenset({VehicleSection.MAINTENANCE, VehicleSection.HEALTH})
+
     entity_description = SensorEntityDescription(
         key="milage",
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -625,6 +593,8 @@ class Mileage(MySkodaSensor):
 class InspectionInterval(MySkodaSensor):
     """The number of days before next inspection."""
 
+    sections = frozenset({VehicleSection.MAINTENANCE})
+
     entity_description = SensorEntityDescription(
         key="inspection",
         device_class=SensorDeviceClass.DURATION,
@@ -642,6 +612,8 @@ class InspectionInterval(MySkodaSensor):
 class InspectionIntervalKM(MySkodaSensor):
     """The number of kilometers before inspection is due."""
 
+    sections = frozenset({VehicleSection.MAINTENANCE})
+
     entity_description = SensorEntityDescription(
         key="inspection_in_km",
         device_class=SensorDeviceClass.DISTANCE,
@@ -659,6 +631,9 @@ class InspectionIntervalKM(MySkodaSensor):
 class OilServiceIntervalDays(MySkodaSensor):
     """The number of days before oil service is due."""
 
+    sections = frozenset({VehicleSection.MAINTENANCE})
+    required_capabilities = frozenset({CapabilityId.FUEL_STATUS})
+
     entity_description = SensorEntityDescription(
         key="oil_service_in_days",
         device_class=SensorDeviceClass.DURATION,
@@ -672,13 +647,13 @@ class OilServiceIntervalDays(MySkodaSensor):
         if maintenance_report := self.vehicle.maintenance.maintenance_report:
             return maintenance_report.oil_service_due_in_days
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.FUEL_STATUS]
-
 
 class OilServiceIntervalKM(MySkodaSensor):
     """The number of kilometers before oil service is due."""
 
+    sections = frozenset({VehicleSection.MAINTENANCE})
+    required_capabilities = frozenset({CapabilityId.FUEL_STATUS})
+
     entity_description = SensorEntityDescription(
         key="oil_service_in_km",
         device_class=SensorDeviceClass.DISTANCE,
@@ -692,9 +667,6 @@ class OilServiceIntervalKM(MySkodaSensor):
         if maintenance_report := self.vehicle.maintenance.maintenance_report:
             return maintenance_report.oil_service_due_in_km
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.FUEL_STATUS]
-
 
 class ChargeType(ChargingSensor):
     """How the vehicle is being charged (AC/DC)."""
@@ -756,6 +728,10 @@ class RemainingChargingTime(ChargingSensor):
 class ChargingRate(ChargingSensor):
     """Estimation on how many kmh are being charged."""
 
+    required_capabilities = frozenset(
+        {CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS}
+    )
+
     entity_description = SensorEntityDescription(
         key="charging_rate",
         device_class=SensorDeviceClass.SPEED,
@@ -768,13 +744,13 @@ class ChargingRate(ChargingSensor):
         if status := self._status():
             return status.charging_rate_in_kilometers_per_hour
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS]
-
 
 class LastUpdated(MySkodaSensor):
     """Timestamp of when the car has sent the last update to the MySkoda server."""
 
+    sections = frozenset({VehicleSection.STATUS})
+    required_capabilities = frozenset({CapabilityId.STATE})
+
     entity_description = SensorEntityDescription(
         key="car_captured",
         device_class=SensorDeviceClass.TIMESTAMP,
@@ -786,13 +762,15 @@ class LastUpdated(MySkodaSensor):
         if status := self.vehicle.status:
             return status.car_captured_timestamp
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.STATE]
-
 
 class OutsideTemperature(MySkodaSensor):
     """Measured temperature outside the car."""
 
+    sections = frozenset(
+        {VehicleSection.AUXILIARY_HEATING, VehicleSection.AIR_CONDITIONING}
+    )
+    required_capabilities = frozenset({CapabilityId.OUTSIDE_TEMPERATURE})
+
     entity_description = SensorEntityDescription(
         key="outside_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -809,13 +787,13 @@ class OutsideTemperature(MySkodaSensor):
                 if OUTSIDE_TEMP_MIN_BOUND < temp_value < OUTSIDE_TEMP_MAX_BOUND:
                     return temp_value
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.OUTSIDE_TEMPERATURE]
-
 
 class ClimatisationTimeLeft(MySkodaSensor):
     """Estimated time left until climatisation via AC has reached its goal."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING})
+
     entity_description = SensorEntityDescription(
         key="estimated_time_left_to_reach_target_temperature",
         device_class=SensorDeviceClass.DURATION,
@@ -836,13 +814,13 @@ class ClimatisationTimeLeft(MySkodaSensor):
                 # If we reached it already, return 0
                 return max(0, int(duration.total_seconds()))
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING]
-
 
 class AuxHeaterTimeLeft(MySkodaSensor):
     """Estimated time left until climatisation via aux heater has reached its goal."""
 
+    sections = frozenset({VehicleSection.AUXILIARY_HEATING})
+    required_capabilities = frozenset({CapabilityId.AUXILIARY_HEATING})
+
     entity_description = SensorEntityDescription(
         key="aux_estimated_time_left_to_reach_target_temperature",
         device_class=SensorDeviceClass.DURATION,
@@ -862,13 +840,29 @@ class AuxHeaterTimeLeft(MySkodaSensor):
                 # If we reached it already, return 0
                 return max(0, int(duration.total_seconds()))
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AUXILIARY_HEATING]
+
+class PollInterval(MySkodaSensor):
+    """Current interval between scheduled refreshes of the vehicle data."""
+
+    entity_description = SensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
+
+    @property
+    def native_value(self) -> float | None:  # noqa: D102
+        if interval := self.coordinator.update_interval:
+            return interval.total_seconds() / 60
 
 
 class TripStatisticSensor(MySkodaSensor):
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.TRIP_STATISTICS]
+    sections = frozenset(
+        {VehicleSection.TRIP_STATISTICS, VehicleSection.SINGLE_TRIP_STATISTICS}
+    )
+    required_capabilities = frozenset({CapabilityId.TRIP_STATISTICS})
 
 
 class OverallMileage(TripStatisticSensor):
@@ -0,0 +1,174 @@
+"""Copy-on-write snapshots of MySkoda vehicle and user data."""
+
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import StrEnum
+from typing import Any, Self, overload
+
+from myskoda import Vehicle
+from myskoda.models.chargingprofiles import (
+    ChargingProfile,
+    ChargingProfiles,
+    ChargingTimers,
+    ChargingTimes,
+)
+from myskoda.models.info import Info, ViewPoint, ViewType
+from myskoda.models.user import User
+
+
+class VehicleSection(StrEnum):
+    """Top-level sections of a Vehicle, named after the Vehicle attributes."""
+
+    INFO = "info"
+    MAINTENANCE = "maintenance"
+    CHARGING = "charging"
+    CHARGING_PROFILES = "charging_profiles"
+    STATUS = "status"
+    AIR_CONDITIONING = "air_conditioning"
+    AUXILIARY_HEATING = "auxiliary_heating"
+    POSITIONS = "positions"
+    PARKING_POSITION = "parking_position"
+    DRIVING_RANGE = "driving_range"
+    TRIP_STATISTICS = "trip_statistics"
+    SINGLE_TRIP_STATISTICS = "single_trip_statistics"
+    HEALTH = "health"
+    DEPARTURE_INFO = "departure_info"
+    CONNECTION_STATUS = "connection_status"
+    SOFTWARE_UPDATE_STATUS = "software_update_status"
+
+
+class EventSection(StrEnum):
+    """Parts of the coordinator state that are fed by MQTT events."""
+
+    OPERATIONS = "operations"
+    SERVICE_EVENTS = "service_events"
+
+
+type Section = VehicleSection | EventSection
+
+
+def _unchanged(live: Any, snapshot: Any) -> bool:
+    """Compare a live section with its snapshot, ignoring the fetch timestamp.
+
+    Every API response carries the time at which it was fetched, so refetching
+    identical data would otherwise always count as a change.
+    """
+    if live is None or snapshot is None:
+        return live is snapshot
+    if type(live) is not type(snapshot):
+        return False
+    if not is_dataclass(live):
+        return live == snapshot
+    return all(
+        getattr(live, field.name) == getattr(snapshot, field.name)
+        for field in fields(live)
+        if field.name != "timestamp"
+    )
+
+
+def snapshot_vehicle(
+    live: Vehicle, previous: Vehicle | None
+) -> tuple[Vehicle, frozenset[VehicleSection]]:
+    """Return a snapshot of the live vehicle and the sections that changed.
+
+    Sections equal to those in `previous` are shared with it, only the changed
+    ones are deep-copied. The snapshot never references objects owned by the
+    MySkoda library, which updates some sections in place.
+
+    When nothing changed, `previous` itself is returned.
+    """
+    if previous is None:
+        return deepcopy(live), frozenset(VehicleSection)
+
+    changed = frozenset(
+        section
+        for section in VehicleSection
+        if not _unchanged(
+            getattr(live, section, None), getattr(previous, section, None)
+        )
+    )
+    if not changed:
+        return previous, changed
+
+    snapshot = copy(previous)
+    for section in changed:
+        setattr(snapshot, section, deepcopy(getattr(live, section, None)))
+    return snapshot, changed
+
+
+@dataclass(frozen=True)
+class ChargingProfileIndex:
+    """Charging profiles of a snapshot, keyed by profile id.
+
+    Preferred charging times and timers are keyed by (profile id, entry id).
+    """
+
+    source: ChargingProfiles | None = field(default=None, compare=False)
+    profiles: dict[int, ChargingProfile] = field(default_factory=dict)
+    charging_times: dict[tuple[int, int], ChargingTimes] = field(default_factory=dict)
+    timers: dict[tuple[int, int], ChargingTimers] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, source: ChargingProfiles | None) -> Self:
+        """Index the charging profiles of a snapshot."""
+        if source is None:
+            return cls()
+        profiles = {profile.id: profile for profile in source.charging_profiles}
+        return cls(
+            source,
+            profiles,
+            {
+                (profile.id, times.id): times
+                for profile in profiles.values()
+                for times in profile.preferred_charging_times
+            },
+            {
+                (profile.id, timer.id): timer
+                for profile in profiles.values()
+                for timer in profile.timers
+            },
+        )
+
+
+@dataclass(frozen=True)
+class RenderIndex:
+    """Render URLs of a snapshot.
+
+    `renders` is keyed by view_point, `composite_renders` by view_type and
+    then by view_point of the layers.
+    """
+
+    source: Info | None = field(default=None, compare=False)
+    renders: dict[ViewPoint, str] = field(default_factory=dict)
+    composite_renders: dict[ViewType, dict[ViewPoint, str]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def build(cls, source: Info) -> Self:
+        """Index the renders of a snapshot."""
+        return cls(
+            source,
+            {render.view_point: render.url for render in source.renders},
+            {
+                composite.view_type: {
+                    render.view_point: render.url for render in composite.layers
+                }
+                for composite in source.composite_renders
+            },
+        )
+
+
+@overload
+def snapshot_user(live: User, previous: User | None) -> User: ...
+@overload
+def snapshot_user(live: User | None, previous: User) -> User: ...
+@overload
+def snapshot_user(live: User | None, previous: User | None) -> User | None: ...
+def snapshot_user(live: User | None, previous: User | None) -> User | None:
+    """Return a snapshot of the live user, reusing `previous` if nothing changed."""
+    if live is None:
+        return previous
+    if previous is not None and _unchanged(live, previous):
+        return previous
+    return deepcopy(live)
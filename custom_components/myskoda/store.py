@@ -0,0 +1,157 @@
+"""Persistent cache of the last known vehicle and user data."""
+
+import logging
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from functools import cache
+from typing import Any, get_args, get_type_hints
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from mashumaro.exceptions import InvalidFieldValue, MissingField
+
+from myskoda import Vehicle
+from myskoda.models.common import Vin
+from myskoda.models.user import User
+
+from .const import DOMAIN, STORE_SAVE_DELAY_IN_SECONDS
+from .snapshot import VehicleSection
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _serialize(value: Any) -> Any:
+    """Convert a MySkoda model into JSON compatible data, keyed by API field names.
+
+    The models always expect the API field names when deserializing, but only
+    some of them use those names in `to_dict`, so it can't be used to round trip.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.metadata.get("alias") or field.name: _serialize(
+                getattr(value, field.name)
+            )
+            for field in fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, list | tuple):
+        return [_serialize(item) for item in value]
+    if isinstance(value, dict):
+        return {_serialize(key): _serialize(item) for key, item in value.items()}
+    return value
+
+
+@cache
+def _section_type(section: VehicleSection) -> type:
+    """Return the model class of a vehicle section."""
+    hint = get_type_hints(Vehicle)[section]
+    return next((arg for arg in get_args(hint) if arg is not type(None)), hint)
+
+
+def _deserialize_vehicle(data: dict[str, Any]) -> Vehicle | None:
+    """Rebuild a vehicle, skipping any section that can't be deserialized.
+
+    Sections that fail are left empty and will be filled by the next refresh.
+    A vehicle without info or maintenance is unusable and discarded as a whole.
+    """
+    sections = {}
+    for section in VehicleSection:
+        if (value := data.get(section)) is None:
+            continue
+        try:
+            sections[section] = _section_type(section).from_dict(value)
+        except (InvalidFieldValue, MissingField, ValueError):
+            _LOGGER.debug("Discarding cached %s, it can't be deserialized", section)
+
+    info = sections.pop(VehicleSection.INFO, None)
+    maintenance = sections.pop(VehicleSection.MAINTENANCE, None)
+    if info is None or maintenance is None:
+        return None
+
+    vehicle = Vehicle(info, maintenance)
+    for section, value in sections.items():
+        setattr(vehicle, section, value)
+    return vehicle
+
+
+class MySkodaStore:
+    """Keeps the last known data of all vehicles of a config entry on disk.
+
+    This allows setting up the entities right away on startup, before any data
+    has been fetched from the MySkoda API. Sections are serialized only when
+    they change, writes to disk are delayed and combined.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Create a new store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+        self._user: dict[str, Any] | None = None
+        self._vehicles: dict[Vin, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cached data from disk."""
+        if data := await self._store.async_load():
+            self._user = data.get("user")
+            self._vehicles = data.get("vehicles", {})
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk right away."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the cached data from disk."""
+        await self._store.async_remove()
+
+    def restore_user(self) -> User | None:
+        """Return the cached user, if any."""
+        if self._user is None:
+            return None
+        try:
+            return User.from_dict(self._user)
+        except (InvalidFieldValue, MissingField, ValueError):
+            _LOGGER.debug("Discarding cached user, it can't be deserialized")
+            return None
+
+    def restore_vehicle(self, vin: Vin) -> Vehicle | None:
+        """Return the cached vehicle, if any."""
+        if (data := self._vehicles.get(vin)) is None:
+            return None
+        return _deserialize_vehicle(data)
+
+    def update_user(self, user: User | None) -> None:
+        """Cache the user."""
+        if user is None:
+            return
+        self._user = _serialize(user)
+        self._async_schedule_save()
+
+    def update_vehicle(
+        self, vin: Vin, vehicle: Vehicle, sections: frozenset[VehicleSection]
+    ) -> None:
+        """Cache the given sections of a vehicle."""
+        if not sections:
+            return
+        cached = self._vehicles.setdefault(vin, {})
+        for section in sections:
+            cached[section] = _serialize(getattr(vehicle, section, None))
+        self._async_schedule_save()
+
+    def retain_vehicles(self, vins: list[Vin]) -> None:
+        """Drop cached vehicles that are no longer part of the account."""
+        for vin in self._vehicles.keys() - set(vins):
+            del self._vehicles[vin]
+            self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_IN_SECONDS)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"user": self._user, "vehicles": self._vehicles}
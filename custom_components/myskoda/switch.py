@@ -1,8 +1,9 @@
 """Switches for the MySkoda integration."""
 
 import logging
+from collections.abc import Sequence
 from copy import copy
-from datetime import timedelta
+from dataclasses import replace
 from typing import Any, Coroutine
 
 from homeassistant.components.switch import (
@@ -14,11 +15,11 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType  # pyright: ignore [reportAttributeAccessIssue]
-from homeassistant.util import Throttle
 from homeassistant.exceptions import ServiceValidationError
 
 from aiohttp import ClientResponseError
 
+from myskoda import Vehicle
 from myskoda.models.charging import (
     Charging,
     ChargingState,
@@ -39,10 +40,20 @@ from myskoda.models.departure import DepartureTimer
 from myskoda.models.info import CapabilityId
 from myskoda.mqtt import OperationFailedError
 
-from .const import API_COOLDOWN_IN_SECONDS, CONF_READONLY, DOMAIN
-from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
-from .entity import MySkodaChargingTimeEntity, MySkodaChargingTimerEntity, MySkodaEntity
-from .utils import add_supported_charging_time_entities, add_supported_entities
+from .const import CONF_READONLY, DOMAIN
+from .coordinator import MySkodaConfigEntry
+from .entity import (
+    MySkodaChargingTimeEntity,
+    MySkodaChargingTimerEntity,
+    MySkodaEntity,
+    MySkodaTimerEntity,
+)
+from .snapshot import VehicleSection
+from .utils import (
+    add_supported_charging_time_entities,
+    add_supported_entities,
+    add_supported_timer_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,17 +76,16 @@ async def async_setup_entry(
             AcSeatHeatingFrontLeft,
             AcSeatHeatingFrontRight,
             AcWindowHeating,
-            DepartureTimer1,
-            DepartureTimer2,
-            DepartureTimer3,
             AutoUnlockPlug,
-            ACTimer1,
-            ACTimer2,
-            ACTimer3,
         ],
         coordinators=config.runtime_data,
         async_add_entities=async_add_entities,
     )
+    add_supported_timer_entities(
+        available_entities=[DepartureTimerSwitch, ACTimerSwitch],
+        entry=config,
+        async_add_entities=async_add_entities,
+    )
     add_supported_charging_time_entities(
         available_entities=[ChargingTimeSwitch],
         entry_selector=lambda profile: profile.preferred_charging_times,
@@ -93,22 +103,6 @@ async def async_setup_entry(
 class MySkodaSwitch(MySkodaEntity, SwitchEntity):
     """Base class for all switches in the MySkoda integration."""
 
-    def __init__(self, coordinator: MySkodaDataUpdateCoordinator, vin: str):
-        super().__init__(coordinator, vin)
-        self._is_enabled: bool = True
-
-    def is_supported(self) -> bool:
-        all_capabilities_present = all(
-            self.vehicle.has_capability(cap) for cap in self.required_capabilities()
-        )
-
-        return all_capabilities_present
-
-    @property
-    def available(self) -> bool:
-        """Return whether the switch is available to operate."""
-        return self._is_enabled
-
     def _ensure_not_readonly(self):
         if self.coordinator.entry.options.get(CONF_READONLY):
             raise ServiceValidationError(
@@ -116,32 +110,18 @@ class MySkodaSwitch(MySkodaEntity, SwitchEntity):
                 translation_key="readonly_mode",
             )
 
-    def _disable_switch(self):
-        """Turn switch availability off."""
-        self._is_enabled = False
-        self.async_write_ha_state()
-
-    def _enable_switch(self):
-        """Turn switch availability on."""
-        self._is_enabled = True
-        self.async_write_ha_state()
-
     async def _flip_switch(self, to_call: Coroutine):
         """Flip the switch by executing to_call."""
         self._ensure_not_readonly()
-        if not self._is_enabled:
-            return
-
-        self._disable_switch()
-        try:
-            await to_call
-        finally:
-            self._enable_switch()
+        await self.async_send_command(to_call)
 
 
 class WindowHeatingSwitch(MySkodaSwitch):
     """Controls window heating."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.WINDOW_HEATING})
+
     entity_description = SwitchEntityDescription(
         key="window_heating",
         name="Window Heating",
@@ -155,9 +135,8 @@ class WindowHeatingSwitch(MySkodaSwitch):
             if whs := ac.window_heating_state:
                 return whs.front == OnOffState.ON or whs.rear == OnOffState.ON
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
         try:
@@ -175,13 +154,13 @@ class WindowHeatingSwitch(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.WINDOW_HEATING]
-
 
 class ChargingSwitch(MySkodaSwitch):
     """Shows charging."""
 
+    sections = frozenset({VehicleSection.CHARGING})
+    required_capabilities = frozenset({CapabilityId.CHARGING})
+
     entity_description = SwitchEntityDescription(
         key="charging_switch",
         name="Charging",
@@ -202,13 +181,12 @@ class ChargingSwitch(MySkodaSwitch):
         if charging := self._charging():
             return charging.status
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING]
-
 
 class BatteryCareMode(ChargingSwitch):
     """Controls battery care mode."""
 
+    required_capabilities = frozenset({CapabilityId.BATTERY_CHARGING_CARE})
+
     entity_description = SwitchEntityDescription(
         key="battery_care_mode",
         name="Battery Care Mode",
@@ -222,9 +200,8 @@ class BatteryCareMode(ChargingSwitch):
         if settings := self._settings():
             return settings.charging_care_mode == ActiveState.ACTIVATED
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
         try:
@@ -242,9 +219,6 @@ class BatteryCareMode(ChargingSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.BATTERY_CHARGING_CARE]
-
 
 class ReducedCurrent(ChargingSwitch):
     """Control whether to charge with reduced current."""
@@ -262,9 +236,8 @@ class ReducedCurrent(ChargingSwitch):
         if settings := self._settings():
             return settings.max_charge_current_ac == MaxChargeCurrent.REDUCED
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
         try:
@@ -295,9 +268,8 @@ class EnableCharging(ChargingSwitch):
         if status := self._status():
             return status.state == ChargingState.CHARGING
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
         try:
@@ -319,6 +291,10 @@ class EnableCharging(ChargingSwitch):
 class AutoUnlockPlug(ChargingSwitch):
     """Controls unlock plug when charged."""
 
+    required_capabilities = frozenset(
+        {CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS}
+    )
+
     entity_description = SwitchEntityDescription(
         key="auto_unlock_plug",
         name="Auto Unlock Plug",
@@ -332,9 +308,8 @@ class AutoUnlockPlug(ChargingSwitch):
         if settings := self._settings():
             return settings.auto_unlock_plug_when_charged != PlugUnlockMode.OFF
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
         try:
@@ -349,13 +324,13 @@ class AutoUnlockPlug(ChargingSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.CHARGING, CapabilityId.EXTENDED_CHARGING_SETTINGS]
-
 
 class AcAtUnlock(MySkodaSwitch):
     """Enable/disable climatisation when unlocked"""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING_SMART_SETTINGS})
+
     entity_description = SwitchEntityDescription(
         key="ac_at_unlock",
         name="AC when Unlocked",
@@ -370,9 +345,8 @@ class AcAtUnlock(MySkodaSwitch):
             if ac.air_conditioning_at_unlock is not None:
                 return ac.air_conditioning_at_unlock
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         settings = AirConditioningAtUnlock(air_conditioning_at_unlock_enabled=turn_on)
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
@@ -388,13 +362,15 @@ class AcAtUnlock(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING_SMART_SETTINGS]
-
 
 class AcWithoutExternalPower(MySkodaSwitch):
     """Enable/disable climatisation without external power"""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset(
+        {CapabilityId.AIR_CONDITIONING_HEATING_SOURCE_ELECTRIC}
+    )
+
     entity_description = SwitchEntityDescription(
         key="ac_without_external_power",
         name="AC without External Power",
@@ -409,9 +385,8 @@ class AcWithoutExternalPower(MySkodaSwitch):
             if ac.air_conditioning_without_external_power is not None:
                 return ac.air_conditioning_without_external_power
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         settings = AirConditioningWithoutExternalPower(
             air_conditioning_without_external_power_enabled=turn_on
         )
@@ -433,13 +408,13 @@ class AcWithoutExternalPower(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING_HEATING_SOURCE_ELECTRIC]
-
 
 class AcSeatHeatingFrontLeft(MySkodaSwitch):
     """Enable/disable front left seat heating during climatisation."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING_SMART_SETTINGS})
+
     entity_description = SwitchEntityDescription(
         key="ac_seat_heating_front_left",
         name="Front Left Seat Heating with AC",
@@ -457,9 +432,8 @@ class AcSeatHeatingFrontLeft(MySkodaSwitch):
         ):
             return ac.seat_heating_activated.front_left
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         settings = SeatHeating(front_left=turn_on)
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
@@ -477,13 +451,13 @@ class AcSeatHeatingFrontLeft(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING_SMART_SETTINGS]
-
 
 class AcSeatHeatingFrontRight(MySkodaSwitch):
     """Enable/disable front right seat heating during climatisation."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING_SMART_SETTINGS})
+
     entity_description = SwitchEntityDescription(
         key="ac_seat_heating_front_right",
         name="Front Right Seat Heating with AC",
@@ -501,9 +475,8 @@ class AcSeatHeatingFrontRight(MySkodaSwitch):
         ):
             return ac.seat_heating_activated.front_right
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         settings = SeatHeating(front_right=turn_on)
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
@@ -521,13 +494,13 @@ class AcSeatHeatingFrontRight(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING_SMART_SETTINGS]
-
 
 class AcWindowHeating(MySkodaSwitch):
     """Enable/disable window heating during climatisation."""
 
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING_SMART_SETTINGS})
+
     entity_description = SwitchEntityDescription(
         key="ac_window_heating",
         name="Window Heating with AC",
@@ -542,9 +515,8 @@ class AcWindowHeating(MySkodaSwitch):
             if ac.window_heating_enabled is not None:
                 return ac.window_heating_enabled
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         settings = WindowHeating(window_heating_enabled=turn_on)
         myskoda, vin = self.coordinator.myskoda, self.vehicle.info.vin
         action = "on" if turn_on else "off"
@@ -560,30 +532,25 @@ class AcWindowHeating(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):  # noqa: D102
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        return [CapabilityId.AIR_CONDITIONING_SMART_SETTINGS]
-
-
-class DepartureTimerSwitch(MySkodaSwitch):
-    """Base class for departure timers, handling common functionality."""
-
-    def __init__(self, coordinator, vin, timer_id: int, **kwargs):
-        """Initialize the departure timer switch."""
-        super().__init__(coordinator, vin)  # Initialize parent class (MySkodaEntity)
-        self.timer_id = timer_id  # Store the specific timer ID for each subclass
-
-    def get_timer(self) -> DepartureTimer | None:
-        """Retrieve the specific departure timer by ID."""
-        if departure_info := self.vehicle.departure_info:
-            if departure_info.timers:
-                return next(
-                    (
-                        timer
-                        for timer in departure_info.timers
-                        if timer.id == self.timer_id
-                    ),
-                    None,
-                )
+
+class DepartureTimerSwitch(MySkodaTimerEntity[DepartureTimer], MySkodaSwitch):
+    """Enable/disable a single departure timer."""
+
+    sections = frozenset({VehicleSection.DEPARTURE_INFO})
+    required_capabilities = frozenset({CapabilityId.DEPARTURE_TIMERS})
+
+    entity_description = SwitchEntityDescription(
+        key="departure_timer",
+        device_class=SwitchDeviceClass.SWITCH,
+        translation_key="departure_timer",
+        entity_category=EntityCategory.CONFIG,
+    )
+
+    @classmethod
+    def select_timers(cls, vehicle: Vehicle) -> Sequence[DepartureTimer]:  # noqa: D102
+        if vehicle.departure_info and vehicle.departure_info.timers:
+            return vehicle.departure_info.timers
+        return []
 
     @property
     def is_on(self) -> bool | None:
@@ -598,13 +565,13 @@ class DepartureTimerSwitch(MySkodaSwitch):
             return timer.to_dict()  # Return timer configuration as state attributes
         return {}
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
         """Turn the timer on or off."""
         myskoda = self.coordinator.myskoda
         action = "on" if turn_on else "off"
         if timer := self.get_timer():
-            timer.enabled = turn_on
+            # work on copy so that the coordinator's state is not changed
+            timer = replace(timer, enabled=turn_on)
             try:
                 await self._flip_switch(myskoda.set_departure_timer(self.vin, timer))
             except (ClientResponseError, OperationFailedError) as exc:
@@ -628,81 +595,25 @@ class DepartureTimerSwitch(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        """Return the capabilities required for the departure timer."""
-        return [CapabilityId.DEPARTURE_TIMERS]
-
 
-class DepartureTimer1(DepartureTimerSwitch):
-    """Enable/disable departure timer 1."""
-
-    entity_description = SwitchEntityDescription(
-        key="departure_timer_1",
-        name="Departure Timer 1",
-        device_class=SwitchDeviceClass.SWITCH,
-        translation_key="departure_timer_1",
-        entity_category=EntityCategory.CONFIG,
-    )
-
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=1, **kwargs)
-
-
-class DepartureTimer2(DepartureTimerSwitch):
-    """Enable/disable departure timer 2."""
-
-    entity_description = SwitchEntityDescription(
-        key="departure_timer_2",
-        name="Departure Timer 2",
-        device_class=SwitchDeviceClass.SWITCH,
-        translation_key="departure_timer_2",
-        entity_category=EntityCategory.CONFIG,
-    )
-
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=2, **kwargs)
+class ACTimerSwitch(MySkodaTimerEntity[AirConditioningTimer], MySkodaSwitch):
+    """Enable/disable a single air-conditioning timer."""
 
-
-class DepartureTimer3(DepartureTimerSwitch):
-    """Enable/disable departure timer 3."""
+    sections = frozenset({VehicleSection.AIR_CONDITIONING})
+    required_capabilities = frozenset({CapabilityId.AIR_CONDITIONING_TIMERS})
 
     entity_description = SwitchEntityDescription(
-        key="departure_timer_3",
-        name="Departure Timer 3",
+        key="ac_timer",
         device_class=SwitchDeviceClass.SWITCH,
-        translation_key="departure_timer_3",
+        translation_key="ac_timer",
         entity_category=EntityCategory.CONFIG,
     )
 
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=3, **kwargs)
-
-
-class ACTimerSwitch(MySkodaSwitch):
-    """Base class for air-conditioning timers, handling common functionality."""
-
-    def __init__(self, coordinator, vin, timer_id: int, **kwargs):
-        """Initialize the departure timer switch."""
-        super().__init__(coordinator, vin)  # Initialize parent class (MySkodaEntity)
-        self.timer_id = timer_id  # Store the specific timer ID for each subclass
-
-    def get_timer(self) -> AirConditioningTimer | None:
-        """Retrieve the specific ac timer by ID."""
-        if air_conditioning := self.vehicle.air_conditioning:
-            if air_conditioning.timers:
-                return next(
-                    (
-                        timer
-                        for timer in air_conditioning.timers
-                        if timer.id == self.timer_id
-                    ),
-                    None,
-                )
-
-    @property
-    def available(self) -> bool:
-        """Determine whether the sensor is available."""
-        return self._is_enabled and bool(self.get_timer())
+    @classmethod
+    def select_timers(cls, vehicle: Vehicle) -> Sequence[AirConditioningTimer]:  # noqa: D102
+        if vehicle.air_conditioning and vehicle.air_conditioning.timers:
+            return vehicle.air_conditioning.timers
+        return []
 
     @property
     def is_on(self) -> bool | None:
@@ -717,13 +628,13 @@ class ACTimerSwitch(MySkodaSwitch):
             return timer.to_dict()  # Return timer configuration as state attributes
         return {}
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
         """Turn the timer on or off."""
         myskoda = self.coordinator.myskoda
         action = "on" if turn_on else "off"
         if timer := self.get_timer():
-            timer.enabled = turn_on
+            # work on copy so that the coordinator's state is not changed
+            timer = replace(timer, enabled=turn_on)
             try:
                 await self._flip_switch(myskoda.set_ac_timer(self.vin, timer))
             except (ClientResponseError, OperationFailedError) as exc:
@@ -749,55 +660,6 @@ class ACTimerSwitch(MySkodaSwitch):
     async def async_turn_on(self, **kwargs):
         await self._async_turn_on_off(turn_on=True)
 
-    def required_capabilities(self) -> list[CapabilityId]:
-        """Return the capabilities required for the departure timer."""
-        return [CapabilityId.AIR_CONDITIONING_TIMERS]
-
-
-class ACTimer1(ACTimerSwitch):
-    """Enable/disable air-conditioning timer 1."""
-
-    entity_description = SwitchEntityDescription(
-        key="ac_timer_1",
-        name="AirConditioning Timer 1",
-        device_class=SwitchDeviceClass.SWITCH,
-        translation_key="ac_timer_1",
-        entity_category=EntityCategory.CONFIG,
-    )
-
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=1, **kwargs)
-
-
-class ACTimer2(ACTimerSwitch):
-    """Enable/disable air-conditioning timer 2."""
-
-    entity_description = SwitchEntityDescription(
-        key="ac_timer_2",
-        name="AirConditioning Timer 2",
-        device_class=SwitchDeviceClass.SWITCH,
-        translation_key="ac_timer_2",
-        entity_category=EntityCategory.CONFIG,
-    )
-
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=2, **kwargs)
-
-
-class ACTimer3(ACTimerSwitch):
-    """Enable/disable air-conditioning timer 3."""
-
-    entity_description = SwitchEntityDescription(
-        key="ac_timer_3",
-        name="AirConditioning Timer 3",
-        device_class=SwitchDeviceClass.SWITCH,
-        translation_key="ac_timer_3",
-        entity_category=EntityCategory.CONFIG,
-    )
-
-    def __init__(self, coordinator, vin, **kwargs):
-        super().__init__(coordinator, vin, timer_id=3, **kwargs)
-
 
 class ChargingTimeSwitch(MySkodaChargingTimeEntity, MySkodaSwitch):
     """Enable/disable a single preferred charging time window of a charging profile."""
@@ -824,9 +686,8 @@ class ChargingTimeSwitch(MySkodaChargingTimeEntity, MySkodaSwitch):
             }
         return {}
 
-    @Throttle(timedelta(seconds=API_COOLDOWN_IN_SECONDS))
     async def _async_turn_on_off(self, turn_on: bool):
-        """Internal method to have a central location for the Throttle."""
+        """Internal method to have a central location for turning on and off."""
         myskoda = self.coordinator.myskoda
         action = "on" if turn_on else "off"
         if times := self.charging_time:
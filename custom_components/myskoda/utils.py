@@ -1,41 +1,54 @@
-from collections.abc import Sequence
+from collections.abc import Hashable, Iterable, Sequence
 from typing import Callable, Protocol
 
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from myskoda.models.chargingprofiles import ChargingProfile
 from myskoda.models.common import Vin
 
-from .coordinator import MySkodaDataUpdateCoordinator
-from .entity import MySkodaEntity
+from .coordinator import MySkodaConfigEntry, MySkodaDataUpdateCoordinator
+from .entity import (
+    MySkodaChargingProfileEntity,
+    MySkodaChargingTimeEntity,
+    MySkodaChargingTimerEntity,
+    MySkodaEntity,
+    MySkodaTimerEntity,
+)
 
 
 class _HasId(Protocol):
     id: int
 
 
+def _applicable_classes[T: type[MySkodaEntity]](
+    available_entities: list[T], coordinator: MySkodaDataUpdateCoordinator
+) -> list[T]:
+    """Return the entity classes that apply to the vehicle of the coordinator."""
+    capabilities = coordinator.capabilities
+    return [
+        EntityClass
+        for EntityClass in available_entities
+        if EntityClass.is_applicable(capabilities)
+    ]
+
+
 def add_supported_entities(
-    available_entities: list[
-        Callable[[MySkodaDataUpdateCoordinator, Vin], MySkodaEntity]
-    ],
+    available_entities: list[type[MySkodaEntity]],
     coordinators: dict[Vin, MySkodaDataUpdateCoordinator],
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     entities = []
 
-    for vin in coordinators:
-        for SensorClass in available_entities:
-            sensor = SensorClass(coordinators[vin], vin)
-            if not sensor.is_forbidden():
-                if sensor.is_supported():
-                    entities.append(sensor)
+    for vin, coordinator in coordinators.items():
+        for SensorClass in _applicable_classes(available_entities, coordinator):
+            entities.append(SensorClass(coordinator, vin))
 
     async_add_entities(entities, update_before_add=True)
 
 
 def add_supported_charging_profile_entities(
-    available_entities: list[
-        Callable[[MySkodaDataUpdateCoordinator, Vin, int], MySkodaEntity]
-    ],
+    available_entities: list[type[MySkodaChargingProfileEntity]],
     coordinators: dict[Vin, MySkodaDataUpdateCoordinator],
     async_add_entities: AddEntitiesCallback,
 ) -> None:
@@ -50,7 +63,8 @@ def add_supported_charging_profile_entities(
 
     def _add_new_profiles(vin: Vin, coordinator: MySkodaDataUpdateCoordinator) -> None:
         profiles = coordinator.data.vehicle.charging_profiles
-        if not profiles:
+        supported = _applicable_classes(available_entities, coordinator)
+        if not profiles or not supported:
             return
 
         new_entities = []
@@ -59,10 +73,8 @@ def add_supported_charging_profile_entities(
                 continue
             known_profile_ids[vin].add(profile.id)
 
-            for EntityClass in available_entities:
-                entity = EntityClass(coordinator, vin, profile.id)
-                if not entity.is_forbidden() and entity.is_supported():
-                    new_entities.append(entity)
+            for EntityClass in supported:
+                new_entities.append(EntityClass(coordinator, vin, profile.id))
 
         if new_entities:
             async_add_entities(new_entities, update_before_add=True)
@@ -76,7 +88,7 @@ def add_supported_charging_profile_entities(
 
 def add_supported_charging_time_entities(
     available_entities: list[
-        Callable[[MySkodaDataUpdateCoordinator, Vin, int, int], MySkodaEntity]
+        type[MySkodaChargingTimeEntity] | type[MySkodaChargingTimerEntity]
     ],
     entry_selector: Callable[[ChargingProfile], Sequence[_HasId]],
     coordinators: dict[Vin, MySkodaDataUpdateCoordinator],
@@ -96,7 +108,8 @@ def add_supported_charging_time_entities(
 
     def _add_new_entries(vin: Vin, coordinator: MySkodaDataUpdateCoordinator) -> None:
         profiles = coordinator.data.vehicle.charging_profiles
-        if not profiles:
+        supported = _applicable_classes(available_entities, coordinator)
+        if not profiles or not supported:
             return
 
         new_entities = []
@@ -107,10 +120,10 @@ def add_supported_charging_time_entities(
                     continue
                 known_entry_ids[vin].add(key)
 
-                for EntityClass in available_entities:
-                    entity = EntityClass(coordinator, vin, profile.id, entry.id)
-                    if not entity.is_forbidden() and entity.is_supported():
-                        new_entities.append(entity)
+                for EntityClass in supported:
+                    new_entities.append(
+                        EntityClass(coordinator, vin, profile.id, entry.id)
+                    )
 
         if new_entities:
             async_add_entities(new_entities, update_before_add=True)
@@ -120,3 +133,65 @@ def add_supported_charging_time_entities(
         coordinator.async_add_listener(
             lambda vin=vin, coordinator=coordinator: _add_new_entries(vin, coordinator)
         )
+
+
+def add_entities_for_new_keys[K: Hashable](
+    entry: MySkodaConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    keys: Callable[[MySkodaDataUpdateCoordinator], Iterable[K]],
+    create: Callable[[MySkodaDataUpdateCoordinator, Vin, K], Entity],
+    update_before_add: bool = False,
+) -> None:
+    """Create an entity per key found in the data of each vehicle.
+
+    What `keys` finds can change with every update of the coordinator, so the
+    keys are listed again after each update and entities are created for the
+    ones not seen before. The listeners are removed when the entry is unloaded.
+    """
+
+    def _watch(vin: Vin, coordinator: MySkodaDataUpdateCoordinator) -> None:
+        known: set[K] = set()
+
+        @callback
+        def _add_new_entities() -> None:
+            new_entities = []
+            for key in keys(coordinator):
+                if key in known:
+                    continue
+                known.add(key)
+                new_entities.append(create(coordinator, vin, key))
+            if new_entities:
+                async_add_entities(new_entities, update_before_add=update_before_add)
+
+        _add_new_entities()
+        entry.async_on_unload(coordinator.async_add_listener(_add_new_entities))
+
+    for vin, coordinator in entry.runtime_data.items():
+        _watch(vin, coordinator)
+
+
+def add_supported_timer_entities(
+    available_entities: list[type[MySkodaTimerEntity]],
+    entry: MySkodaConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Register one entity per timer of the vehicle.
+
+    The number of timers differs between vehicles, so entities are created for
+    the timers found in the data, selected per class via `select_timers`.
+    """
+
+    def _timers(
+        coordinator: MySkodaDataUpdateCoordinator,
+    ) -> Iterable[tuple[type[MySkodaTimerEntity], int]]:
+        for EntityClass in _applicable_classes(available_entities, coordinator):
+            for timer in EntityClass.select_timers(coordinator.data.vehicle):
+                yield EntityClass, timer.id
+
+    add_entities_for_new_keys(
+        entry,
+        async_add_entities,
+        _timers,
+        lambda coordinator, vin, key: key[0](coordinator, vin, key[1]),
+        update_before_add=True,
+    )